@@ -1,13 +1,146 @@
 """
 NBA Stats Fetcher using nba_api
 Provides player stats, game logs, and today's games
+
+Usage:
+    python nbaFetcher.py <command> [args]         One-shot (forwards to a running daemon if any)
+    python nbaFetcher.py bulk_hit_rates '[["LeBron James", "pts", 25.5], [2544, "reb", 7.5]]' [last_n]
+    python nbaFetcher.py prop_profile 2544 '{"pts": [20.5, 25.5, 30.5]}' '[5, 10, 20]'
+    python nbaFetcher.py prefetch_slate           Warm the game-log store for today's rostered players
+    python nbaFetcher.py prefetch_slate --stream  Same through the daemon, one progress record (with ETA) per player
+    python nbaFetcher.py <command> [args] --stream   NDJSON frames: record per entity, error, end
+    python nbaFetcher.py serve                    Daemon: NDJSON requests on stdin, responses on stdout
+    python nbaFetcher.py serve --socket [PATH]    Daemon: NDJSON over a local Unix socket
+
+Daemon request:  {"id": 1, "command": "player_logs", "args": [2544, 10]}
+Daemon response: {"id": 1, "result": {...}}
+Add "stream": true to a request to get {"id", "type": "record" | "error" | "end", ...} lines instead.
 """
 
+import base64
 import json
+import os
+import pickle
+import socket
+import sqlite3
+import struct
 import sys
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+try:
+    import fcntl  # Cross-process rate limiting (Unix); in-process only elsewhere
+except ImportError:
+    fcntl = None
+
+# Local socket shared by the daemon and the thin CLI client
+SOCKET_PATH = os.environ.get('NBA_FETCHER_SOCKET', os.path.join(tempfile.gettempdir(), 'nbaFetcher.sock'))
+
+def request_daemon(command, args, socket_path=SOCKET_PATH, connect_timeout=5):
+    """
+    Send one request to a running daemon and wait for its answer.
+    Returns None only if no daemon accepts the connection; once the request is
+    sent, a broken or garbled reply comes back as an error result rather than
+    None, so the caller never runs the command a second time in-process.
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(connect_timeout)
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    
+    try:
+        with sock:
+            sock.settimeout(None)  # prefetch_slate or a cold bulk_hit_rates can take minutes
+            sock.sendall((json.dumps({"id": 0, "command": command, "args": args}) + '\n').encode())
+            with sock.makefile('r', encoding='utf-8') as reader:
+                line = reader.readline()
+        if not line:
+            return {"error": "Daemon closed the connection without a response"}
+        return json.loads(line)['result']
+    except (OSError, ValueError, KeyError) as e:
+        return {"error": f"Daemon request failed: {e}"}
+
+def stream_daemon(command, args, socket_path=SOCKET_PATH, connect_timeout=5):
+    """
+    Relay a streaming request's frames to stdout as they arrive; False if no daemon is listening.
+    A connection that breaks mid-stream still ends with a fatal error frame and an end frame.
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return False
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(connect_timeout)
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return False
+    
+    records = 0
+    errors = 0
+    try:
+        with sock:
+            sock.settimeout(None)
+            sock.sendall((json.dumps({"id": 0, "command": command, "args": args, "stream": True}) + '\n').encode())
+            with sock.makefile('r', encoding='utf-8') as reader:
+                for line in reader:
+                    frame = json.loads(line)
+                    frame.pop('id', None)
+                    print(json.dumps(frame), flush=True)
+                    if frame.get('type') == 'end':
+                        return True
+                    if frame.get('type') == 'error':
+                        errors += 1
+                    else:
+                        records += 1
+        error = "Daemon closed the connection mid-stream"
+    except (OSError, ValueError) as e:
+        error = f"Daemon stream failed: {e}"
+    
+    print(json.dumps({"type": "error", "error": error, "fatal": True}), flush=True)
+    print(json.dumps({"type": "end", "records": records, "errors": errors + 1}), flush=True)
+    return True
+
+def read_stdin_props(command, args):
+    """CLI only: swap a bulk_hit_rates '-' props argument for the JSON piped on stdin"""
+    if command != 'bulk_hit_rates':
+        return args
+    args = list(args)
+    for i, arg in enumerate(args):
+        if arg != '--stream':
+            if arg == '-':
+                args[i] = sys.stdin.read()
+            break
+    return args
+
+# Thin client: answer from the warm daemon before paying for the nba_api import
+if __name__ == '__main__' and len(sys.argv) > 1 and sys.argv[1] != 'serve':
+    sys.argv[2:] = read_stdin_props(sys.argv[1], sys.argv[2:])  # The daemon can't see our stdin
+    if '--stream' in sys.argv:
+        if stream_daemon(sys.argv[1], [arg for arg in sys.argv[2:] if arg != '--stream']):
+            sys.exit(0)
+    _forwarded = None
+    # prefetch_slate reports progress on stderr, which a forwarded run would leave on the daemon's
+    if '--stream' not in sys.argv and sys.argv[1] != 'prefetch_slate':
+        _forwarded = request_daemon(sys.argv[1], sys.argv[2:])
+    if isinstance(_forwarded, dict) and _forwarded.get('encoding') == 'base64':
+        sys.stdout.buffer.write(base64.b64decode(_forwarded['data']))
+        sys.exit(0)
+    if isinstance(_forwarded, dict) and _forwarded.pop('usage', False):
+        print(json.dumps(_forwarded))
+        sys.exit(1)
+    if _forwarded is not None:
+        print(json.dumps(_forwarded))
+        sys.exit(0)
+
 try:
     from nba_api.stats.endpoints import (
         playergamelog, 
@@ -17,19 +150,248 @@ try:
         teamgamelog
     )
     from nba_api.stats.static import players, teams
+    import numpy as np  # Installed with nba_api
 except ImportError:
     print(json.dumps({"error": "nba_api not installed. Run: pip install nba_api"}))
     sys.exit(1)
 
 # Rate limit delay (600ms recommended)
 RATE_LIMIT_DELAY = 0.6
+# Last-request timestamp shared by every nbaFetcher process on this machine
+RATE_LIMIT_FILE = os.environ.get('NBA_RATE_LIMIT_FILE', os.path.join(tempfile.gettempdir(), 'nbaFetcher.ratelimit'))
+
+PRIORITY_INTERACTIVE = 0  # A user is waiting on the answer
+PRIORITY_BACKGROUND = 1   # Prefetch / warm-up work
+
+# ============================================
+# Request Scheduler (stats.nba.com rate limit)
+# ============================================
+class RequestScheduler:
+    """
+    Spaces nba_api requests RATE_LIMIT_DELAY apart across threads and processes.
+    - Waits only for what is left of the window since the last request anywhere
+    - Identical requests already in flight share one call
+    - Interactive requests take the next slot ahead of queued background ones
+    """
+    
+    def __init__(self, delay, lock_path):
+        self.delay = delay
+        self.lock_path = lock_path
+        self._cond = threading.Condition()
+        self._busy = False
+        self._interactive_waiting = 0
+        self._last_local = 0.0
+        self._in_flight = {}  # {request key: Future}
+        self._in_flight_lock = threading.Lock()
+    
+    def _wait_for_window(self):
+        """Sleep out the remainder of the rate-limit window, then stamp this request"""
+        if fcntl is None:
+            wait = self._last_local + self.delay - time.time()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_local = time.time()
+            return
+        
+        with open(self.lock_path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read().strip()
+                try:
+                    last = float(raw) if raw else 0.0
+                except ValueError:
+                    last = 0.0
+                
+                wait = last + self.delay - time.time()
+                if wait > 0:
+                    time.sleep(wait)
+                
+                f.seek(0)
+                f.truncate()
+                f.write(repr(time.time()))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def _take_slot(self, priority):
+        with self._cond:
+            interactive = priority == PRIORITY_INTERACTIVE
+            if interactive:
+                self._interactive_waiting += 1
+            self._cond.wait_for(lambda: not self._busy and (interactive or self._interactive_waiting == 0))
+            self._busy = True
+            if interactive:
+                self._interactive_waiting -= 1
+        
+        try:
+            self._wait_for_window()
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+    
+    def fetch(self, endpoint, priority=PRIORITY_INTERACTIVE, **params):
+        """Call an nba_api endpoint class under the rate limit; returns its normalized dict"""
+        key = (endpoint.__module__, endpoint.__name__, tuple(sorted(params.items())))
+        
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            self._take_slot(priority)
+            result = endpoint(**params).get_normalized_dict()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(key, None)
+
+scheduler = RequestScheduler(RATE_LIMIT_DELAY, RATE_LIMIT_FILE)
+
+# Optional pickle of the built player/team lookup indexes (empty = build in memory each start)
+LOOKUP_CACHE_PATH = os.environ.get('NBA_LOOKUP_CACHE', '')
+LOOKUP_CACHE_VERSION = 2
+
+# Slate prefetch: concurrent workers (the scheduler still spaces the actual requests)
+PREFETCH_WORKERS = int(os.environ.get('NBA_PREFETCH_WORKERS', '4'))
+
+# Local game-log store: refreshed incrementally, at most once per game day per player
+GAME_LOG_DB = os.environ.get('NBA_GAME_LOG_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nba_game_logs.db'))
+# A game day is over (all box scores final) at this UTC hour the next morning (~5-6am ET)
+GAME_DAY_ROLLOVER_HOUR_UTC = int(os.environ.get('NBA_GAME_DAY_ROLLOVER_HOUR_UTC', '10'))
+# Columnar season logs kept in memory (daemon), most recently used first out
+LOG_COLUMNS_CACHE_SIZE = int(os.environ.get('NBA_LOG_COLUMNS_CACHE_SIZE', '600'))
+
+# ============================================
+# Player / Team Lookup Tables
+# ============================================
+_lookup = None
+
+def normalize_name(name):
+    """Lowercase, strip accents and punctuation: 'Nikola Jokić' -> 'nikola jokic'"""
+    import unicodedata
+    name = unicodedata.normalize('NFKD', name or '')
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = ''.join(ch if ch.isalnum() else ' ' for ch in name.lower())
+    return ' '.join(name.split())
+
+def build_lookup():
+    """Build id, normalized-name and sorted token indexes from nba_api's static lists"""
+    player_list = players.get_players()
+    team_list = teams.get_teams()
+    
+    names = {}
+    tokens = []
+    for player in player_list:
+        normalized = normalize_name(player['full_name'])
+        names.setdefault(normalized, []).append(player['id'])
+        for token in set(normalized.split()):
+            tokens.append((token, player['id']))
+    tokens.sort()
+    
+    return {
+        'players': {str(p['id']): p for p in player_list},
+        'teams': {str(t['id']): t for t in team_list},
+        'names': names,
+        'tokens': tokens
+    }
+
+def lookup_cache_key():
+    """Stamp for the on-disk lookup cache: the static lists only change with an nba_api release"""
+    import nba_api
+    return (LOOKUP_CACHE_VERSION, getattr(nba_api, '__version__', None))
+
+def get_lookup():
+    """Lookup tables, built once per process (and unpickled from/saved to LOOKUP_CACHE_PATH if set)"""
+    global _lookup
+    if _lookup is not None:
+        return _lookup
+    
+    cache_key = lookup_cache_key() if LOOKUP_CACHE_PATH else None
+    if LOOKUP_CACHE_PATH and os.path.exists(LOOKUP_CACHE_PATH):
+        try:
+            with open(LOOKUP_CACHE_PATH, 'rb') as f:
+                cached_key, cached = pickle.load(f)
+            if cached_key == cache_key:  # Same format and nba_api release as this process
+                _lookup = cached
+                return _lookup
+        except (OSError, ValueError, TypeError, EOFError, pickle.UnpicklingError):
+            pass
+    
+    _lookup = build_lookup()
+    
+    if LOOKUP_CACHE_PATH:
+        try:
+            tmp_path = LOOKUP_CACHE_PATH + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, _lookup), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, LOOKUP_CACHE_PATH)
+        except OSError:
+            pass
+    
+    return _lookup
+
+def _ids_with_token_prefix(prefix):
+    """All player ids having a name token that starts with `prefix` (binary search on the sorted tokens)"""
+    from bisect import bisect_left
+    tokens = get_lookup()['tokens']
+    ids = set()
+    i = bisect_left(tokens, (prefix,))
+    while i < len(tokens) and tokens[i][0].startswith(prefix):
+        ids.add(tokens[i][1])
+        i += 1
+    return ids
+
+def search_players(player_name, limit=10):
+    """
+    Rank players for a name query:
+    exact full name > every query word prefixes a name word > substring.
+    Active players sort first within each tier.
+    """
+    lookup = get_lookup()
+    query = normalize_name(player_name)
+    if not query:
+        return []
+    
+    ranked = []
+    seen = set()
+    
+    def add(ids, tier):
+        tier_players = [lookup['players'][str(pid)] for pid in ids if pid not in seen]
+        tier_players.sort(key=lambda p: (not p['is_active'], p['full_name']))
+        for player in tier_players:
+            seen.add(player['id'])
+            ranked.append(dict(player, match=tier))
+    
+    add(lookup['names'].get(query, []), 'exact')
+    
+    words = query.split()
+    prefix_ids = _ids_with_token_prefix(words[0])
+    for word in words[1:]:
+        prefix_ids &= _ids_with_token_prefix(word)
+    add(prefix_ids, 'prefix')
+    
+    # Substring fallback (the old behaviour), only needed when the indexes found nothing
+    if not ranked:
+        add([pid for name, ids in lookup['names'].items() if query in name for pid in ids], 'partial')
+    
+    return ranked[:limit]
 
 def get_todays_games():
     """Get today's NBA games"""
     try:
-        time.sleep(RATE_LIMIT_DELAY)
-        scoreboard = scoreboardv2.ScoreboardV2(game_date=datetime.now().strftime('%Y-%m-%d'))
-        games = scoreboard.get_normalized_dict()
+        games = scheduler.fetch(scoreboardv2.ScoreboardV2, game_date=datetime.now().strftime('%Y-%m-%d'))
         
         result = []
         for game in games.get('GameHeader', []):
@@ -49,64 +411,260 @@ def get_todays_games():
 
 def get_team_name(team_id):
     """Get team name by ID"""
-    team_list = teams.get_teams()
-    for team in team_list:
-        if team['id'] == team_id:
-            return team['full_name']
-    return f"Team {team_id}"
+    team = get_lookup()['teams'].get(str(team_id))
+    return team['full_name'] if team else f"Team {team_id}"
 
 def get_player_id(player_name):
     """Find player ID by name"""
-    player_list = players.get_players()
-    for player in player_list:
-        if player_name.lower() in player['full_name'].lower():
-            return player['id']
-    return None
+    matches = search_players(player_name, limit=1)
+    return matches[0]['id'] if matches else None
 
-def get_player_game_logs(player_id, season='2024-25', last_n=20):
-    """Get player's last N game logs"""
+# ============================================
+# Game Log Store (SQLite)
+# ============================================
+GAME_LOG_COLUMNS = ('game_id', 'date', 'matchup', 'wl', 'min', 'pts', 'reb', 'ast', 'stl', 'blk', 'tov', 'fg3m')
+
+def open_game_log_db():
+    """One connection per call/thread; WAL lets the daemon and one-shot CLIs share the file"""
+    conn = sqlite3.connect(GAME_LOG_DB, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS game_logs (
+            player_id INTEGER NOT NULL,
+            season TEXT NOT NULL,
+            game_id TEXT NOT NULL,
+            game_date TEXT NOT NULL,
+            date TEXT, matchup TEXT, wl TEXT, min INTEGER,
+            pts INTEGER, reb INTEGER, ast INTEGER, stl INTEGER, blk INTEGER, tov INTEGER, fg3m INTEGER,
+            PRIMARY KEY (player_id, season, game_id)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS game_log_refresh (
+            player_id INTEGER NOT NULL,
+            season TEXT NOT NULL,
+            checked_at REAL NOT NULL,
+            PRIMARY KEY (player_id, season)
+        )
+    ''')
+    return conn
+
+def last_game_day_rollover(now=None):
+    """Most recent moment at which the previous game day's box scores are final (epoch seconds)"""
+    from datetime import timezone
+    now = now or datetime.now(timezone.utc)
+    rollover = now.replace(hour=GAME_DAY_ROLLOVER_HOUR_UTC, minute=0, second=0, microsecond=0)
+    if now < rollover:
+        rollover -= timedelta(days=1)
+    return rollover.timestamp()
+
+def parse_game_date(game_date):
+    """'APR 14, 2024' -> '2024-04-14' (sortable)"""
     try:
-        time.sleep(RATE_LIMIT_DELAY)
-        gamelog = playergamelog.PlayerGameLog(
-            player_id=player_id,
-            season=season,
-            season_type_all_star='Regular Season'
+        return datetime.strptime(game_date, '%b %d, %Y').strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        return game_date or ''
+
+def logs_are_fresh(conn, player_id, season):
+    row = conn.execute(
+        'SELECT checked_at FROM game_log_refresh WHERE player_id = ? AND season = ?', (player_id, season)
+    ).fetchone()
+    return row is not None and row[0] >= last_game_day_rollover()
+
+def refresh_player_logs(conn, player_id, season, priority=PRIORITY_INTERACTIVE):
+    """Fetch only games since the newest stored one (the whole season on first sight)"""
+    newest = conn.execute(
+        'SELECT MAX(game_date) FROM game_logs WHERE player_id = ? AND season = ?', (player_id, season)
+    ).fetchone()[0]
+    date_from = datetime.strptime(newest, '%Y-%m-%d').strftime('%m/%d/%Y') if newest else ''
+    
+    games = scheduler.fetch(
+        playergamelog.PlayerGameLog,
+        priority=priority,
+        player_id=player_id,
+        season=season,
+        season_type_all_star='Regular Season',
+        date_from_nullable=date_from
+    )['PlayerGameLog']
+    
+    with conn:
+        conn.executemany(
+            '''INSERT OR REPLACE INTO game_logs
+               (player_id, season, game_id, game_date, date, matchup, wl, min, pts, reb, ast, stl, blk, tov, fg3m)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+            [
+                (player_id, season, game.get('Game_ID'), parse_game_date(game.get('GAME_DATE')),
+                 game.get('GAME_DATE'), game.get('MATCHUP'), game.get('WL'), game.get('MIN'),
+                 game.get('PTS'), game.get('REB'), game.get('AST'), game.get('STL'),
+                 game.get('BLK'), game.get('TOV'), game.get('FG3M'))
+                for game in games
+            ]
+        )
+        conn.execute(
+            'INSERT OR REPLACE INTO game_log_refresh (player_id, season, checked_at) VALUES (?, ?, ?)',
+            (player_id, season, time.time())
         )
-        games = gamelog.get_normalized_dict()['PlayerGameLog']
+    return len(games)
+
+# ============================================
+# Columnar Game Logs
+# ============================================
+STAT_COLUMNS = ('pts', 'reb', 'ast', 'stl', 'blk', 'tov', 'fg3m')
+BINARY_MAGIC = b'NBAL'
+
+class PlayerLogColumns:
+    """
+    One season of a player's games, newest first, one typed array per stat.
+    pra and home are derived once at load; to_games() rebuilds the JSON shape.
+    """
+    
+    __slots__ = ('player_id', 'game_id', 'date', 'matchup', 'wl', 'min', 'stats', 'home', 'loaded_at', 'stale')
+    
+    def __init__(self, player_id, rows, stale=False):
+        """rows: SELECT {GAME_LOG_COLUMNS} results, newest first"""
+        n = len(rows)
+        columns = list(zip(*rows)) if rows else [()] * len(GAME_LOG_COLUMNS)
+        by_name = dict(zip(GAME_LOG_COLUMNS, columns))
+        
+        self.player_id = player_id
+        self.game_id = list(by_name['game_id'])
+        self.date = list(by_name['date'])
+        self.matchup = list(by_name['matchup'])
+        self.wl = list(by_name['wl'])
+        self.min = np.array([np.nan if m is None else m for m in by_name['min']], dtype=np.float32)
+        self.stats = {
+            stat: np.fromiter((v or 0 for v in by_name[stat]), dtype=np.int16, count=n)
+            for stat in STAT_COLUMNS
+        }
+        self.stats['pra'] = (self.stats['pts'] + self.stats['reb'] + self.stats['ast']).astype(np.int16)
+        self.home = np.fromiter(('@' not in (m or '') for m in self.matchup), dtype=bool, count=n)
+        self.loaded_at = time.time()
+        self.stale = stale
+    
+    def __len__(self):
+        return len(self.game_id)
+    
+    def column(self, market, last_n=None):
+        """Stat column (pts/reb/.../pra) as float64, optionally only the newest last_n games"""
+        return self.stats[market][:last_n].astype(np.float64)
+    
+    def to_games(self, last_n=None):
+        """Backward-compatible list of 14-key game dicts"""
+        games = []
+        for i in range(min(len(self), last_n) if last_n is not None else len(self)):
+            minutes = float(self.min[i])
+            game = {
+                'game_id': self.game_id[i],
+                'date': self.date[i],
+                'matchup': self.matchup[i],
+                'wl': self.wl[i],
+                'min': None if minutes != minutes else (int(minutes) if minutes.is_integer() else minutes)
+            }
+            for stat in STAT_COLUMNS:
+                game[stat] = int(self.stats[stat][i])
+            game['pra'] = int(self.stats['pra'][i])
+            game['home'] = bool(self.home[i])
+            games.append(game)
+        return games
+    
+    def to_binary(self, last_n=None):
+        """
+        Compact binary form for the Node side:
+        b'NBAL' | uint32 LE header length | JSON header | little-endian column buffers.
+        The header lists each column's name, dtype, byte offset and length (relative to
+        the end of the header), plus the string columns inline.
+        """
+        count = min(len(self), last_n) if last_n is not None else len(self)
+        arrays = [('min', self.min[:count])]
+        arrays += [(stat, self.stats[stat][:count]) for stat in STAT_COLUMNS + ('pra',)]
+        arrays.append(('home', self.home[:count].astype(np.uint8)))
         
-        # Get last N games
-        games = games[:last_n]
+        columns = []
+        buffers = []
+        offset = 0
+        for name, array in arrays:
+            data = array.astype(array.dtype.newbyteorder('<')).tobytes()
+            columns.append({"name": name, "dtype": array.dtype.name, "offset": offset, "length": count})
+            buffers.append(data)
+            offset += len(data)
         
-        result = []
-        for game in games:
-            result.append({
-                'game_id': game.get('Game_ID'),
-                'date': game.get('GAME_DATE'),
-                'matchup': game.get('MATCHUP'),
-                'wl': game.get('WL'),
-                'min': game.get('MIN'),
-                'pts': game.get('PTS'),
-                'reb': game.get('REB'),
-                'ast': game.get('AST'),
-                'stl': game.get('STL'),
-                'blk': game.get('BLK'),
-                'tov': game.get('TOV'),
-                'fg3m': game.get('FG3M'),
-                'pra': game.get('PTS', 0) + game.get('REB', 0) + game.get('AST', 0),
-                'home': '@' not in game.get('MATCHUP', '')
-            })
+        header = json.dumps({
+            "player_id": self.player_id,
+            "count": count,
+            "columns": columns,
+            "strings": {
+                "game_id": self.game_id[:count],
+                "date": self.date[:count],
+                "matchup": self.matchup[:count],
+                "wl": self.wl[:count]
+            }
+        }, separators=(',', ':')).encode()
+        return BINARY_MAGIC + struct.pack('<I', len(header)) + header + b''.join(buffers)
+
+_log_columns = OrderedDict()  # {(player_id, season): PlayerLogColumns}
+_log_columns_lock = threading.Lock()
+
+def load_player_log_columns(conn, player_id, season, stale=False):
+    rows = conn.execute(
+        f'''SELECT {', '.join(GAME_LOG_COLUMNS)} FROM game_logs
+            WHERE player_id = ? AND season = ?
+            ORDER BY game_date DESC, game_id DESC''',
+        (player_id, season)
+    ).fetchall()
+    return PlayerLogColumns(player_id, rows, stale=stale)
+
+def get_player_log_columns(player_id, season='2024-25', priority=PRIORITY_INTERACTIVE):
+    """
+    Season log as columns: from memory while current for this game day, otherwise
+    from the local store (refreshed first if stale). Raises if nothing can be served.
+    """
+    key = (player_id, season)
+    with _log_columns_lock:
+        cached = _log_columns.get(key)
+        if cached is not None and not cached.stale and cached.loaded_at >= last_game_day_rollover():
+            _log_columns.move_to_end(key)
+            return cached
+    
+    conn = open_game_log_db()
+    try:
+        refresh_error = None
+        if not logs_are_fresh(conn, player_id, season):
+            try:
+                refresh_player_logs(conn, player_id, season, priority)
+            except Exception as e:
+                # Serve what we have if the API is down; only fail on an empty store
+                refresh_error = e
         
-        return {"success": True, "games": result, "player_id": player_id}
+        columns = load_player_log_columns(conn, player_id, season, stale=refresh_error is not None)
+    finally:
+        conn.close()
+    
+    if refresh_error is not None and len(columns) == 0:
+        raise refresh_error
+    
+    with _log_columns_lock:
+        _log_columns[key] = columns
+        _log_columns.move_to_end(key)
+        while len(_log_columns) > LOG_COLUMNS_CACHE_SIZE:
+            _log_columns.popitem(last=False)
+    return columns
+
+def get_player_game_logs(player_id, season='2024-25', last_n=20, priority=PRIORITY_INTERACTIVE):
+    """Get player's last N game logs (served from the local store, refreshed once per game day)"""
+    try:
+        columns = get_player_log_columns(player_id, season, priority)
+        result = {"success": True, "games": columns.to_games(last_n), "player_id": player_id}
+        if columns.stale:
+            result['stale'] = True
+        return result
     except Exception as e:
         return {"error": str(e)}
 
-def get_team_roster(team_id):
+def get_team_roster(team_id, priority=PRIORITY_INTERACTIVE):
     """Get team roster"""
     try:
-        time.sleep(RATE_LIMIT_DELAY)
         from nba_api.stats.endpoints import commonteamroster
-        roster = commonteamroster.CommonTeamRoster(team_id=team_id)
-        players_data = roster.get_normalized_dict()['CommonTeamRoster']
+        players_data = scheduler.fetch(commonteamroster.CommonTeamRoster, priority=priority, team_id=team_id)['CommonTeamRoster']
         
         result = []
         for player in players_data:
@@ -122,6 +680,108 @@ def get_team_roster(team_id):
     except Exception as e:
         return {"error": str(e)}
 
+# ============================================
+# Slate Prefetch
+# ============================================
+def log_progress(msg):
+    """Progress goes to stderr so stdout stays one JSON document"""
+    print(f"[prefetch] {msg}", file=sys.stderr, flush=True)
+
+def format_eta(seconds):
+    seconds = int(max(0, seconds))
+    return f"{seconds // 60}m{seconds % 60:02d}s"
+
+def iter_prefetch_slate(season='2024-25', workers=PREFETCH_WORKERS):
+    """
+    Warm the game-log store for every rostered player in today's games:
+    games -> rosters -> player logs, as a bounded concurrent pipeline at background priority.
+    Yields one progress event per step, tagged by "stage":
+    "slate" (games/teams), "roster" (errors only), "players" (counts), "player" (one per fetch, with ETA).
+    """
+    games_result = get_todays_games()
+    if 'error' in games_result:
+        yield games_result
+        return
+    
+    team_ids = sorted({
+        team_id for game in games_result['games']
+        for team_id in (game['home_team_id'], game['away_team_id']) if team_id
+    })
+    yield {"stage": "slate", "games": len(games_result['games']), "teams": len(team_ids)}
+    
+    player_ids = []
+    fresh = 0
+    
+    def warm_player(player_id):
+        result = get_player_game_logs(player_id, season=season, last_n=1, priority=PRIORITY_BACKGROUND)
+        return player_id, result
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        roster_futures = {
+            pool.submit(get_team_roster, team_id, PRIORITY_BACKGROUND): team_id for team_id in team_ids
+        }
+        player_futures = []
+        
+        for future in as_completed(roster_futures):
+            roster = future.result()
+            if 'error' in roster:
+                yield {"stage": "roster", "team_id": roster_futures[future], "error": roster['error']}
+                continue
+            
+            conn = open_game_log_db()
+            try:
+                for player in roster['players']:
+                    player_ids.append(player['id'])
+                    if logs_are_fresh(conn, player['id'], season):
+                        fresh += 1
+                    else:
+                        player_futures.append(pool.submit(warm_player, player['id']))
+            finally:
+                conn.close()
+        
+        total = len(player_futures)
+        yield {"stage": "players", "players": len(player_ids), "fresh": fresh, "to_fetch": total}
+        fetch_started = time.time()
+        
+        for done, future in enumerate(as_completed(player_futures), 1):
+            player_id, result = future.result()
+            rate = done / max(time.time() - fetch_started, 1e-6)
+            event = {"stage": "player", "player_id": player_id, "done": done, "total": total,
+                     "eta_s": round((total - done) / rate, 1)}
+            if 'error' in result or result.get('stale'):
+                event['error'] = result.get('error', 'stale')
+            yield event
+
+def prefetch_slate(season='2024-25', workers=PREFETCH_WORKERS):
+    """Run iter_prefetch_slate to completion, logging progress to stderr; returns a summary"""
+    started = time.time()
+    summary = {"success": True, "games": 0, "teams": 0, "players": 0, "fetched": 0, "fresh": 0, "errors": []}
+    
+    for event in iter_prefetch_slate(season, workers):
+        stage = event.get('stage')
+        if stage is None:
+            return event  # Today's games could not be loaded
+        if stage == 'slate':
+            summary.update(games=event['games'], teams=event['teams'])
+            log_progress(f"{event['games']} games, {event['teams']} teams")
+        elif stage == 'roster':
+            summary['errors'].append({"team_id": event['team_id'], "error": event['error']})
+        elif stage == 'players':
+            summary.update(players=event['players'], fresh=event['fresh'])
+            log_progress(f"{event['players']} players, {event['fresh']} already fresh, {event['to_fetch']} to fetch")
+        else:
+            if 'error' in event:
+                summary['errors'].append({"player_id": event['player_id'], "error": event['error']})
+            else:
+                summary['fetched'] += 1
+            log_progress(f"{event['done']}/{event['total']} players ({len(summary['errors'])} errors), "
+                         f"ETA {format_eta(event['eta_s'])}")
+    
+    summary['elapsed_s'] = round(time.time() - started, 1)
+    return summary
+
+MARKETS = ('pts', 'reb', 'ast', 'pra', 'fg3m', 'stl', 'blk', 'tov')
+
 def calculate_hit_rates(games, market, line):
     """Calculate hit rates for a specific market and line"""
     hits = 0
@@ -131,30 +791,178 @@ def calculate_hit_rates(games, market, line):
         return {"hit_rate": 0, "hits": 0, "total": 0}
     
     for game in games:
-        value = 0
-        if market == 'pts':
-            value = game.get('pts', 0)
-        elif market == 'reb':
-            value = game.get('reb', 0)
-        elif market == 'ast':
-            value = game.get('ast', 0)
-        elif market == 'pra':
-            value = game.get('pra', 0)
-        elif market == 'fg3m':
-            value = game.get('fg3m', 0)
-        elif market == 'stl':
-            value = game.get('stl', 0)
-        elif market == 'blk':
-            value = game.get('blk', 0)
-        elif market == 'tov':
-            value = game.get('tov', 0)
-        
+        value = (game.get(market) or 0) if market in MARKETS else 0
         if value > line:
             hits += 1
     
     hit_rate = round((hits / total) * 100, 1)
     return {"hit_rate": hit_rate, "hits": hits, "total": total}
 
+def hit_rate_counts(values, lines):
+    """Vectorized hits of every line over one market column: (hits per line, total)"""
+    hits = (values[np.newaxis, :] > lines[:, np.newaxis]).sum(axis=1)
+    return hits, len(values)
+
+def hit_rate_entry(hits, total):
+    if total == 0:
+        return {"hit_rate": 0, "hits": 0, "total": 0}
+    return {"hit_rate": round((int(hits) / total) * 100, 1), "hits": int(hits), "total": total}
+
+def parse_bulk_requests(raw):
+    """Accept [[player, market, line], ...] or [{"player", "market", "line"}, ...]"""
+    items = json.loads(raw) if isinstance(raw, str) else raw
+    parsed = []
+    for item in items:
+        if isinstance(item, dict):
+            parsed.append((item.get('player'), item.get('market'), item.get('line')))
+        else:
+            player, market, line = item
+            parsed.append((player, market, line))
+    return parsed
+
+def iter_bulk_hit_rates(props, last_n=20):
+    """
+    Score many (player, market, line) props, yielding (index, result) as each is ready.
+    Each player's logs are loaded once; all of that player's lines are counted
+    with one array comparison per market, overall and for home/away splits.
+    Player may be an id or a name.
+    """
+    by_player = {}  # {player_id: [(index, market, line), ...]}
+    
+    for index, (player, market, line) in enumerate(props):
+        base = {"player": player, "market": market, "line": line}
+        if market not in MARKETS:
+            yield index, dict(base, error=f"Unknown market: {market}")
+            continue
+        try:
+            line = float(line)
+        except (TypeError, ValueError):
+            yield index, dict(base, error=f"Invalid line: {line}")
+            continue
+        
+        player_id = int(player) if str(player).isdigit() else get_player_id(str(player))
+        if player_id is None:
+            yield index, dict(base, error="Player not found")
+            continue
+        by_player.setdefault(player_id, []).append((index, market, line))
+    
+    for player_id, player_props in by_player.items():
+        try:
+            columns = get_player_log_columns(player_id)
+        except Exception as e:
+            for index, market, line in player_props:
+                player, _, raw_line = props[index]
+                yield index, {"player": player, "market": market, "line": raw_line, "error": str(e)}
+            continue
+        
+        home = columns.home[:last_n]
+        
+        by_market = {}
+        for index, market, line in player_props:
+            by_market.setdefault(market, []).append((index, line))
+        
+        for market, entries in by_market.items():
+            values = columns.column(market, last_n)
+            lines = np.array([line for _, line in entries], dtype=np.float64)
+            
+            all_hits, total = hit_rate_counts(values, lines)
+            home_hits, home_total = hit_rate_counts(values[home], lines)
+            away_hits, away_total = hit_rate_counts(values[~home], lines)
+            
+            for k, (index, line) in enumerate(entries):
+                player = props[index][0]
+                yield index, dict(
+                    {"player": player, "player_id": player_id, "market": market, "line": line},
+                    **hit_rate_entry(all_hits[k], total),
+                    splits={
+                        'home': dict(hit_rate_entry(home_hits[k], home_total), games=home_total),
+                        'away': dict(hit_rate_entry(away_hits[k], away_total), games=away_total)
+                    }
+                )
+
+def get_bulk_hit_rates(props, last_n=20):
+    """Score many (player, market, line) props in one call; results keep the input order"""
+    results = [None] * len(props)
+    for index, result in iter_bulk_hit_rates(props, last_n):
+        results[index] = result
+    return {"success": True, "last_n": last_n, "results": results}
+
+# ============================================
+# Rolling Window / Streak Engine
+# ============================================
+DEFAULT_LINES = {
+    'pts': 25.5, 'reb': 8.5, 'ast': 6.5, 'pra': 38.5,
+    'fg3m': 2.5, 'stl': 1.5, 'blk': 1.5, 'tov': 3.5
+}
+DEFAULT_WINDOWS = (5, 10, 20)
+
+def over_counts(sorted_values, lines):
+    """Games strictly over each line: binary search on the sorted window (O(log n) per line)"""
+    return len(sorted_values) - np.searchsorted(sorted_values, lines, side='right')
+
+def market_profile(values, lines, windows):
+    """
+    Averages, medians, std devs and hit rates at every line for each last-N window,
+    plus the current over/under streak per line. `values` is newest-first.
+    """
+    n = len(values)
+    lines = np.asarray(sorted(set(lines)), dtype=np.float64)
+    sums = np.concatenate(([0.0], np.cumsum(values)))
+    squares = np.concatenate(([0.0], np.cumsum(values * values)))
+    
+    result = {"windows": {}, "streaks": {}}
+    for label, window in [(f'last{w}', w) for w in windows] + [('season', n)]:
+        size = min(window, n)
+        if size == 0:
+            result['windows'][label] = {"games": 0, "avg": 0, "median": 0, "std": 0, "hit_rates": {}}
+            continue
+        
+        mean = sums[size] / size
+        variance = max(squares[size] / size - mean * mean, 0.0)
+        hits = over_counts(np.sort(values[:size]), lines)
+        
+        result['windows'][label] = {
+            "games": size,
+            "avg": round(float(mean), 2),
+            "median": round(float(np.median(values[:size])), 2),
+            "std": round(float(np.sqrt(variance)), 2),
+            "hit_rates": {
+                f"{line:g}": hit_rate_entry(hit, size) for line, hit in zip(lines, hits)
+            }
+        }
+    
+    # Streaks: length of the newest-first run over (or under/push) each line
+    over = values[np.newaxis, :] > lines[:, np.newaxis]
+    over_streak = np.where(over.all(axis=1), n, np.argmin(over, axis=1)) if n else np.zeros(len(lines), dtype=int)
+    under_streak = np.where((~over).all(axis=1), n, np.argmax(over, axis=1)) if n else np.zeros(len(lines), dtype=int)
+    for line, o, u in zip(lines, over_streak, under_streak):
+        result['streaks'][f"{line:g}"] = {"over": int(o), "under": int(u)}
+    
+    return result
+
+def get_player_prop_profile(player_id, lines=None, windows=DEFAULT_WINDOWS, season='2024-25'):
+    """
+    Rolling-window and streak profile per market from the player's cached season log.
+    lines: {market: [line, ...]} (defaults to DEFAULT_LINES, one line per market)
+    """
+    try:
+        columns = get_player_log_columns(player_id, season)
+    except Exception as e:
+        return {"error": str(e)}
+    
+    lines = lines or {market: [line] for market, line in DEFAULT_LINES.items()}
+    
+    markets = {}
+    for market, market_lines in lines.items():
+        if market not in MARKETS:
+            markets[market] = {"error": f"Unknown market: {market}"}
+            continue
+        values = columns.column(market)
+        market_lines = market_lines if isinstance(market_lines, list) else [market_lines]
+        markets[market] = market_profile(values, [float(line) for line in market_lines], windows)
+    
+    return {"success": True, "data": {"player_id": player_id, "games_analyzed": len(columns), "markets": markets}}
+
 def get_player_hit_rates(player_id, line_pts=25.5, line_reb=8.5, line_ast=6.5, 
                          line_pra=38.5, line_fg3m=2.5, line_stl=1.5, 
                          line_blk=1.5, line_tov=3.5, last_n=20):
@@ -209,45 +1017,214 @@ def get_player_hit_rates(player_id, line_pts=25.5, line_reb=8.5, line_ast=6.5,
     
     return {"success": True, "data": result}
 
-# CLI Interface
-if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "Usage: python nbaFetcher.py <command> [args]"}))
-        sys.exit(1)
-    
-    command = sys.argv[1]
+class UsageError(ValueError):
+    """Missing/invalid command arguments"""
+
+def run_command(command, args):
+    """Dispatch one CLI/daemon command; args are positional (strings from the CLI, any JSON type from the daemon)"""
+    args = [json.dumps(arg) if isinstance(arg, (list, dict)) else str(arg) for arg in args]
     
     if command == 'games':
-        result = get_todays_games()
+        return get_todays_games()
     elif command == 'player_logs':
-        if len(sys.argv) < 3:
-            print(json.dumps({"error": "Player ID required"}))
-            sys.exit(1)
-        player_id = int(sys.argv[2])
-        last_n = int(sys.argv[3]) if len(sys.argv) > 3 else 20
-        result = get_player_game_logs(player_id, last_n=last_n)
+        if len(args) < 1:
+            raise UsageError("Player ID required")
+        binary = '--binary' in args
+        args = [arg for arg in args if arg != '--binary']
+        player_id = int(args[0])
+        last_n = int(args[1]) if len(args) > 1 else 20
+        if binary:
+            return get_player_log_columns(player_id).to_binary(last_n)
+        return get_player_game_logs(player_id, last_n=last_n)
     elif command == 'player_id':
-        if len(sys.argv) < 3:
-            print(json.dumps({"error": "Player name required"}))
-            sys.exit(1)
-        player_name = ' '.join(sys.argv[2:])
+        if len(args) < 1:
+            raise UsageError("Player name required")
+        player_name = ' '.join(args)
         player_id = get_player_id(player_name)
-        result = {"player_id": player_id} if player_id else {"error": "Player not found"}
+        return {"player_id": player_id} if player_id else {"error": "Player not found"}
+    elif command == 'player_search':
+        if len(args) < 1:
+            raise UsageError("Player name required")
+        return {"success": True, "players": search_players(' '.join(args))}
     elif command == 'roster':
-        if len(sys.argv) < 3:
-            print(json.dumps({"error": "Team ID required"}))
-            sys.exit(1)
-        team_id = int(sys.argv[2])
-        result = get_team_roster(team_id)
+        if len(args) < 1:
+            raise UsageError("Team ID required")
+        team_id = int(args[0])
+        return get_team_roster(team_id)
     elif command == 'hit_rates':
-        if len(sys.argv) < 3:
-            print(json.dumps({"error": "Player ID required"}))
-            sys.exit(1)
-        player_id = int(sys.argv[2])
-        result = get_player_hit_rates(player_id)
+        if len(args) < 1:
+            raise UsageError("Player ID required")
+        player_id = int(args[0])
+        return get_player_hit_rates(player_id)
+    elif command == 'bulk_hit_rates':
+        if len(args) < 1:
+            raise UsageError("Props required: JSON list of [player, market, line] (or '-' to read stdin)")
+        if args[0] == '-':
+            raise UsageError("'-' (read props from stdin) only works on the command line; send the props JSON")
+        raw = args[0]
+        last_n = int(args[1]) if len(args) > 1 else 20
+        return get_bulk_hit_rates(parse_bulk_requests(raw), last_n=last_n)
+    elif command == 'prop_profile':
+        if len(args) < 1:
+            raise UsageError("Player ID required")
+        player_id = int(args[0])
+        lines = json.loads(args[1]) if len(args) > 1 else None
+        windows = tuple(json.loads(args[2])) if len(args) > 2 else DEFAULT_WINDOWS
+        return get_player_prop_profile(player_id, lines=lines, windows=windows)
+    elif command == 'prefetch_slate':
+        return prefetch_slate()
     elif command == 'teams':
-        result = {"teams": teams.get_teams()}
+        return {"teams": teams.get_teams()}
+    else:
+        return {"error": f"Unknown command: {command}"}
+
+def iter_command(command, args):
+    """Yield a command's entities one at a time (records carrying 'error' are error frames)"""
+    args = [json.dumps(arg) if isinstance(arg, (list, dict)) else str(arg) for arg in args]
+    
+    if command == 'teams':
+        yield from get_lookup()['teams'].values()
+    elif command == 'games':
+        result = get_todays_games()
+        if 'error' in result:
+            yield result
+        else:
+            yield from result['games']
+    elif command == 'roster':
+        if len(args) < 1:
+            raise UsageError("Team ID required")
+        for team_id in args:  # Streaming accepts several teams
+            roster = get_team_roster(int(team_id))
+            if 'error' in roster:
+                yield {"team_id": int(team_id), "error": roster['error']}
+                continue
+            for player in roster['players']:
+                yield dict(player, team_id=int(team_id))
+    elif command == 'bulk_hit_rates':
+        if len(args) < 1:
+            raise UsageError("Props required: JSON list of [player, market, line] (or '-' to read stdin)")
+        if args[0] == '-':
+            raise UsageError("'-' (read props from stdin) only works on the command line; send the props JSON")
+        raw = args[0]
+        last_n = int(args[1]) if len(args) > 1 else 20
+        for index, result in iter_bulk_hit_rates(parse_bulk_requests(raw), last_n):
+            yield dict(result, index=index)
+    elif command == 'prefetch_slate':
+        yield from iter_prefetch_slate()  # Progress and ETA as records instead of stderr lines
     else:
-        result = {"error": f"Unknown command: {command}"}
+        # Single-result commands stream as one record
+        result = run_command(command, args)
+        if isinstance(result, bytes):
+            result = {"encoding": "base64", "data": base64.b64encode(result).decode()}
+        yield result
+
+def stream_frames(command, args):
+    """
+    NDJSON framing for streaming mode:
+    {"type": "record", "data": {...}} per entity, {"type": "error", "error": ...} per failure,
+    and always a final {"type": "end", "records": n, "errors": k}.
+    """
+    records = 0
+    errors = 0
+    try:
+        for item in iter_command(command, args):
+            if isinstance(item, dict) and 'error' in item:
+                errors += 1
+                yield dict({"type": "error"}, **item)
+            else:
+                records += 1
+                yield {"type": "record", "data": item}
+    except Exception as e:
+        errors += 1
+        yield {"type": "error", "error": str(e), "fatal": True}
+    yield {"type": "end", "records": records, "errors": errors}
+
+def handle_request(line):
+    """Parse one NDJSON request line and yield its NDJSON response line(s)"""
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get('id')
+        if request.get('stream'):
+            for frame in stream_frames(request.get('command'), request.get('args', [])):
+                yield json.dumps(dict(frame, id=request_id))
+            return
+        result = run_command(request.get('command'), request.get('args', []))
+        if isinstance(result, bytes):
+            result = {"encoding": "base64", "data": base64.b64encode(result).decode()}
+    except UsageError as e:
+        result = {"error": str(e), "usage": True}  # Thin client exits 1, like the in-process CLI
+    except Exception as e:
+        result = {"error": str(e)}
+    yield json.dumps({"id": request_id, "result": result})
+
+def serve_stdio():
+    """Daemon mode: one JSON request per stdin line, JSON response line(s) on stdout"""
+    for line in sys.stdin:
+        if line.strip():
+            for response in handle_request(line):
+                print(response, flush=True)
+
+def serve_socket(socket_path=SOCKET_PATH):
+    """Daemon mode on a local Unix socket; each connection may send many request lines"""
+    import socketserver
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if line.strip():
+                    for response in handle_request(line):
+                        self.wfile.write((response + '\n').encode())
+                        self.wfile.flush()
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+    server.daemon_threads = True
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+# CLI Interface
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "Usage: python nbaFetcher.py <command> [args]"}))
+        sys.exit(1)
+    
+    command = sys.argv[1]
+    
+    if command == 'serve':
+        import signal
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Run cleanup (socket unlink) on kill
+        try:
+            if '--socket' in sys.argv:
+                index = sys.argv.index('--socket')
+                serve_socket(sys.argv[index + 1] if len(sys.argv) > index + 1 else SOCKET_PATH)
+            else:
+                serve_stdio()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+    
+    if '--stream' in sys.argv:
+        for frame in stream_frames(command, [arg for arg in sys.argv[2:] if arg != '--stream']):
+            print(json.dumps(frame), flush=True)
+        sys.exit(0)
     
-    print(json.dumps(result))
+    try:
+        result = run_command(command, sys.argv[2:])
+    except UsageError as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(0)
+    
+    if isinstance(result, bytes):
+        sys.stdout.buffer.write(result)
+    else:
+        print(json.dumps(result))
@@ -0,0 +1,307 @@
+"""
+GoalGPT Pro - Scan Pipeline Benchmark
+=====================================
+Runs goalgpt_pro.run_scan against a local stand-in for Flashscore4 and
+Gemini and reports where a scan's time goes:
+- End-to-end scan time and match throughput
+- p50/p99 time-to-signal (scan start -> signal printed)
+- Per-stage cost: fetch, parse, scout, AI (summed over threads; the stages overlap)
+
+Usage:
+    python goalgpt_bench.py --matches 200 --scans 5 --stats-latency 0.15 --gemini-latency 1.0
+"""
+
+import os
+import io
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# ============================================
+# 🎭 Fake Flashscore4 / Gemini Server
+# ============================================
+STAGES = ["5", "12", "18", "25", "33", "39", "Halftime", "52", "58", "63", "67", "72", "77", "82", "88"]
+
+
+def make_live_feed(n_matches, rng):
+    """Synthetic /match/live/1 tournament tree"""
+    tournaments = []
+    for i in range(n_matches):
+        if i % 10 == 0:
+            tournaments.append({"name": f"Bench League {i // 10}", "country_name": "Benchland", "matches": []})
+        tournaments[-1]["matches"].append({
+            "match_id": f"bench{i}",
+            "stage": rng.choice(STAGES),
+            "home_team": {"name": f"Home {i}", "score": rng.choice([0, 0, 0, 1, 2])},
+            "away_team": {"name": f"Away {i}", "score": rng.choice([0, 0, 1, 3])}
+        })
+    return tournaments
+
+
+def make_stats(rng):
+    """Synthetic /match/stats/{id} payload"""
+    def pair(low, high):
+        return rng.randint(low, high), rng.randint(low, high)
+
+    possession = rng.randint(30, 70)
+    rows = [
+        ("Ball possession", f"{possession}%", f"{100 - possession}%"),
+        ("Total shots", *pair(0, 12)),
+        ("Shots on target", *pair(0, 5)),
+        ("Corner kicks", *pair(0, 7)),
+        ("Expected Goals (xG)", *(round(rng.random() * 1.5, 2) for _ in range(2))),
+        ("Big Chances", *pair(0, 45))
+    ]
+    stat_list = [{"name": name, "home_team": home, "away_team": away} for name, home, away in rows]
+    return {"1st-half": stat_list, "all-match": stat_list}
+
+
+def gemini_reply(text):
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+class FakeApiServer:
+    """Threaded local HTTP server with configurable latency and error rate per endpoint"""
+
+    def __init__(self, n_matches, live_latency, stats_latency, gemini_latency, error_rate, seed):
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.live_feed = make_live_feed(n_matches, self.rng)
+        self.latency = {"live": live_latency, "stats": stats_latency, "gemini": gemini_latency}
+        self.error_rate = error_rate
+        self.requests = {"live": 0, "stats": 0, "gemini": 0, "errors": 0}
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _random(self):
+        with self.rng_lock:
+            return self.rng.random()
+
+    def count(self, name):
+        with self.rng_lock:
+            self.requests[name] += 1
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, endpoint, body):
+                server.count(endpoint)
+                time.sleep(server.latency[endpoint])
+
+                if server._random() < server.error_rate:
+                    server.count("errors")
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.endswith("/match/live/1"):
+                    self._respond("live", server.live_feed)
+                elif "/match/stats/" in self.path:
+                    with server.rng_lock:
+                        stats = make_stats(server.rng)
+                    self._respond("stats", stats)
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                prompt = payload.get("contents", [{}])[0].get("parts", [{}])[0].get("text", "")
+
+                def verdict():
+                    play = server._random() < 0.5
+                    return {
+                        "verdict": "PLAY" if play else "SKIP",
+                        "confidence": 76 + int(server._random() * 20) if play else 40,
+                        "reason": "Synthetic benchmark verdict."
+                    }
+
+                match_ids = re.findall(r"\[MATCH_ID: ([^\]]+)\]", prompt)
+                if match_ids:
+                    text = json.dumps([dict(verdict(), match_id=match_id) for match_id in match_ids])
+                else:
+                    text = json.dumps(verdict())
+                self._respond("gemini", gemini_reply(text))
+
+        return Handler
+
+
+# ============================================
+# ⏲️ Instrumentation
+# ============================================
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))  # Nearest-rank
+    return ordered[rank - 1]
+
+
+class StageTimer:
+    """Wraps goalgpt_pro functions in place and accumulates wall time per stage"""
+
+    STAGES = {
+        "fetch": ("fetch_live_feed", "fetch_match_stats_cached"),
+        "parse": ("flatten_live_feed", "parse_stats"),
+        "scout": ("scout_batch",),
+        "ai": ("ask_gemini_batch",)
+    }
+
+    def __init__(self, module):
+        self.module = module
+        self.totals = {stage: 0.0 for stage in self.STAGES}
+        self.signal_times = []
+        self.scan_started = 0.0
+        self._lock = threading.Lock()
+
+        for stage, names in self.STAGES.items():
+            for name in names:
+                setattr(module, name, self._timed(stage, getattr(module, name)))
+        module.handle_verdict = self._signal_hook(module.handle_verdict)
+
+    def _timed(self, stage, func):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.totals[stage] += time.perf_counter() - started
+        return wrapper
+
+    def _signal_hook(self, func):
+        def wrapper(*args, **kwargs):
+            alerted = func(*args, **kwargs)
+            if alerted:
+                with self._lock:
+                    self.signal_times.append(time.perf_counter() - self.scan_started)
+            return alerted
+        return wrapper
+
+
+# ============================================
+# 🏁 Benchmark Runner
+# ============================================
+def reset_scan_state(g):
+    """Fresh caches/cooldowns so every scan exercises the full pipeline"""
+    g.cooldowns.clear()
+    g.match_snapshots = g.MatchSnapshotStore(g.SNAPSHOT_STALE_SECONDS)
+    g.stats_cache = g.TTLCache(g.STATS_CACHE_SIZE)
+    g.verdict_cache = g.TTLCache(g.VERDICT_CACHE_SIZE)
+
+
+def run_benchmark(args):
+    server = FakeApiServer(
+        args.matches, args.live_latency, args.stats_latency,
+        args.gemini_latency, args.error_rate, args.seed
+    ).start()
+
+    # goalgpt_pro reads its configuration at import time
+    os.environ["RAPIDAPI_BASE_URL"] = server.url
+    os.environ["GEMINI_BASE_URL"] = server.url
+    os.environ["RAPIDAPI_RATE_PER_SEC"] = str(args.rate)
+    os.environ["RAPIDAPI_BURST"] = str(args.burst)
+    os.environ["RECORD_DIR"] = ""
+    os.environ["COOLDOWN_DB"] = ""
+    os.environ["PRESCREEN_MODEL"] = ""
+    import goalgpt_pro as g
+
+    timer = StageTimer(g)
+    scan_times = []
+    candidates_total = 0
+    alerts_total = 0
+
+    try:
+        for _ in range(args.scans):
+            reset_scan_state(g)
+            timer.scan_started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                candidates, alerts = g.run_scan()
+            scan_times.append(time.perf_counter() - timer.scan_started)
+            candidates_total += candidates
+            alerts_total += alerts
+    finally:
+        server.stop()
+
+    total_time = sum(scan_times)
+    return {
+        "config": vars(args),
+        "scans": args.scans,
+        "scan_p50_s": round(percentile(scan_times, 50), 3),
+        "scan_max_s": round(max(scan_times), 3),
+        "matches_per_s": round(args.matches * args.scans / total_time, 1) if total_time else 0.0,
+        "candidates": candidates_total,
+        "signals": alerts_total,
+        "time_to_signal_p50_s": round(percentile(timer.signal_times, 50), 3),
+        "time_to_signal_p99_s": round(percentile(timer.signal_times, 99), 3),
+        "stage_s_per_scan": {stage: round(total / args.scans, 3) for stage, total in timer.totals.items()},
+        "requests": dict(server.requests)
+    }
+
+
+def print_report(result):
+    print(f"Scans: {result['scans']} | p50 {result['scan_p50_s']}s | max {result['scan_max_s']}s")
+    print(f"Throughput: {result['matches_per_s']} matches/s")
+    print(f"Candidates: {result['candidates']} | Signals: {result['signals']}")
+    print(f"Time-to-signal: p50 {result['time_to_signal_p50_s']}s | p99 {result['time_to_signal_p99_s']}s")
+    print("Per-stage (s/scan): " + " | ".join(f"{stage} {t}" for stage, t in result["stage_s_per_scan"].items()))
+    print("Requests: " + " | ".join(f"{name} {count}" for name, count in result["requests"].items()))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the goalgpt_pro scan pipeline against a local fake API")
+    parser.add_argument("--matches", type=int, default=200, help="Live matches in the synthetic feed")
+    parser.add_argument("--scans", type=int, default=5, help="Scans to run")
+    parser.add_argument("--live-latency", type=float, default=0.2, help="Seconds per /match/live/1 response")
+    parser.add_argument("--stats-latency", type=float, default=0.15, help="Seconds per /match/stats response")
+    parser.add_argument("--gemini-latency", type=float, default=1.0, help="Seconds per Gemini response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of responses returned as 503")
+    parser.add_argument("--rate", type=float, default=1000.0, help="RAPIDAPI_RATE_PER_SEC for the run")
+    parser.add_argument("--burst", type=int, default=1000, help="RAPIDAPI_BURST for the run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    result = run_benchmark(args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
@@ -6,18 +6,38 @@ Features:
 - Dual Scout Filter: First Half Sniper + Late Game Momentum
 - Gemini AI validation for final decisions
 - Flashscore4 API integration with full match statistics
+- Sharded mode (`python goalgpt_pro.py shards N`): N worker processes split the live matches
 
 Author: GoalGPT Team
 API: Flashscore4 (RapidAPI) + Google Gemini
 """
 
 import os
+import re
+import math
+import bisect
+import sys
 import time
 import json
+import gzip
+import zlib
+import queue
+import sqlite3
+import threading
 import requests
-from datetime import datetime, timedelta
+import multiprocessing
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Vectorized scout engine falls back to the per-match scouts
+
 # Load environment variables
 load_dotenv()
 
@@ -25,17 +45,66 @@ load_dotenv()
 # ⚙️ Configuration
 # ============================================
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY", "YOUR_RAPIDAPI_KEY")
+# Sharded mode: comma-separated keys, worker i uses key i % len (default: RAPIDAPI_KEY for all)
+RAPIDAPI_KEYS = [key.strip() for key in os.getenv("RAPIDAPI_KEYS", "").split(",") if key.strip()] or [RAPIDAPI_KEY]
 RAPIDAPI_HOST = "flashscore4.p.rapidapi.com"
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "YOUR_GEMINI_API_KEY")
 
-POLL_INTERVAL = 180  # 3 minutes
+# Base URLs (overridable so benchmarks can point at a local stand-in server)
+RAPIDAPI_BASE_URL = os.getenv("RAPIDAPI_BASE_URL", f"https://{RAPIDAPI_HOST}")
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com")
+
+POLL_INTERVAL = 180  # 3 minutes (baseline; see Poll Scheduler)
 COOLDOWN_MINUTES = 15  # Prevent spam alerts
+COOLDOWN_DB = os.getenv("COOLDOWN_DB", "goalgpt_cooldowns.db")  # Survives restarts (empty = memory only)
 
-# ============================================
-# 💾 State Management
-# ============================================
-alert_history = {}  # {match_id: last_alert_time}
+# Stats fetch stage (replaces the fixed 0.5s sleep between matches)
+STATS_MAX_INFLIGHT = int(os.getenv("STATS_MAX_INFLIGHT", "8"))  # Concurrent stats requests
+RAPIDAPI_RATE_PER_SEC = float(os.getenv("RAPIDAPI_RATE_PER_SEC", "5"))  # Sustained request rate
+RAPIDAPI_BURST = int(os.getenv("RAPIDAPI_BURST", "10"))  # Requests allowed back-to-back
+
+# Shared HTTP clients (keep-alive pools + retry/backoff on 429/5xx)
+GEMINI_POOL_SIZE = int(os.getenv("GEMINI_POOL_SIZE", "4"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))  # 0.5s, 1s, 2s...
+
+# Differential scanning: re-evaluate unchanged matches at most this often
+SNAPSHOT_STALE_SECONDS = int(os.getenv("SNAPSHOT_STALE_SECONDS", "360"))
+
+# Stats cache: TTL depends on match phase, finished matches never expire
+STATS_CACHE_SIZE = int(os.getenv("STATS_CACHE_SIZE", "500"))
+STATS_TTL_LIVE = int(os.getenv("STATS_TTL_LIVE", "240"))
+STATS_TTL_PEAK = int(os.getenv("STATS_TTL_PEAK", "90"))  # 65'-78' peak goal window
+STATS_TTL_HALFTIME = int(os.getenv("STATS_TTL_HALFTIME", "900"))
+
+# Adaptive polling: faster near strategy windows, slower when idle, capped by budget
+POLL_MIN_INTERVAL = int(os.getenv("POLL_MIN_INTERVAL", "60"))
+POLL_IDLE_INTERVAL = int(os.getenv("POLL_IDLE_INTERVAL", "900"))
+POLL_LEAD_MINUTES = int(os.getenv("POLL_LEAD_MINUTES", "5"))  # "About to enter a window"
+DAILY_REQUEST_BUDGET = int(os.getenv("DAILY_REQUEST_BUDGET", "3000"))  # RapidAPI requests/day
 
+# Gemini: candidates validated per model call
+GEMINI_BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "8"))
+
+# Gemini verdict cache: a match re-qualifying with near-identical numbers reuses its last verdict
+VERDICT_CACHE_SIZE = int(os.getenv("VERDICT_CACHE_SIZE", "500"))
+VERDICT_CACHE_TTL = int(os.getenv("VERDICT_CACHE_TTL", "600"))
+VERDICT_MINUTE_BUCKET = int(os.getenv("VERDICT_MINUTE_BUCKET", "5"))
+
+# Local pre-screen model (see `train`): only the uncertain band goes to Gemini
+PRESCREEN_MODEL = os.getenv("PRESCREEN_MODEL", "goalgpt_prescreen.json")  # Missing file = off
+PRESCREEN_SKIP_BELOW = float(os.getenv("PRESCREEN_SKIP_BELOW", "0.15"))  # Local SKIP under this probability
+PRESCREEN_PLAY_ABOVE = float(os.getenv("PRESCREEN_PLAY_ABOVE", "0.85"))  # Local PLAY over this probability
+
+# Scan pipeline: stats -> scout -> Gemini run concurrently, joined by bounded queues
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "32"))  # Full queue = upstream waits
+GEMINI_WORKERS = int(os.getenv("GEMINI_WORKERS", str(GEMINI_POOL_SIZE)))  # Concurrent Gemini calls
+
+# Feed recording for offline replay (empty = off)
+RECORD_DIR = os.getenv("RECORD_DIR", "")
+
+# Sharded mode: longest the coordinator waits for workers to finish one scan
+SHARD_SCAN_TIMEOUT = int(os.getenv("SHARD_SCAN_TIMEOUT", "300"))
 
 # ============================================
 # 🎨 Console Styling
@@ -75,54 +144,244 @@ def log_api(msg):
 
 
 # ============================================
-# 📡 Flashscore4 API Functions
+# ⏳ Rate Limiting
 # ============================================
-def fetch_live_matches():
-    """Fetch all live football matches from Flashscore4"""
-    url = f"https://{RAPIDAPI_HOST}/api/flashscore/v1/match/live/1"
-    headers = {
+class TokenBucket:
+    """Thread-safe token bucket: refills at `rate` tokens/sec up to `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available, then consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class DailyRequestCounter:
+    """Thread-safe count of requests made today (resets at local midnight)"""
+
+    def __init__(self):
+        self._day = date.today()
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _roll(self):
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._count = 0
+
+    def increment(self, count=1):
+        with self._lock:
+            self._roll()
+            self._count += count
+
+    def today(self):
+        with self._lock:
+            self._roll()
+            return self._count
+
+
+rapidapi_bucket = TokenBucket(RAPIDAPI_RATE_PER_SEC, RAPIDAPI_BURST)
+rapidapi_usage = DailyRequestCounter()
+
+
+# ============================================
+# 🔌 HTTP Clients
+# ============================================
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session(pool_size, headers=None, retries=HTTP_RETRIES):
+    """Keep-alive session with a sized connection pool and (optional) adapter retry/backoff"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+rapidapi_session = build_session(
+    # Live feed + every in-flight stats request can share one pool
+    STATS_MAX_INFLIGHT + 1,
+    headers={
         "X-RapidAPI-Key": RAPIDAPI_KEY,
         "X-RapidAPI-Host": RAPIDAPI_HOST
-    }
+    },
+    retries=0  # Retried by rapidapi_get, so every attempt is rate limited and counted
+)
+gemini_session = build_session(GEMINI_POOL_SIZE)
+
+
+def retry_delay(response, attempt):
+    """Retry-After if the server sent seconds, else exponential HTTP_BACKOFF"""
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.strip().isdigit():
+        return float(retry_after)
+    return HTTP_BACKOFF * (2 ** attempt)
+
+
+def rapidapi_get(url, timeout=30):
+    """
+    GET from RapidAPI, retrying 429/5xx and connection errors up to HTTP_RETRIES times.
+    Every attempt takes a rapidapi_bucket token and counts toward rapidapi_usage.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        rapidapi_bucket.acquire()
+        rapidapi_usage.increment()
+        
+        try:
+            response = rapidapi_session.get(url, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == HTTP_RETRIES:
+                raise
+            response = None
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return response
+        
+        time.sleep(retry_delay(response, attempt))
+
+
+# ============================================
+# 🧊 Stats Cache
+# ============================================
+FINISHED_STAGES = ("finished", "ended", "after pen", "after extra")
+
+
+def stats_ttl(stage):
+    """Seconds a stats payload stays valid for a match in this stage (None = forever)"""
+    stage_str = str(stage or "").lower()
+    
+    if "halftime" in stage_str:
+        return STATS_TTL_HALFTIME
+    if stage_str == "ft" or any(marker in stage_str for marker in FINISHED_STAGES):
+        return None
+    
+    elapsed = parse_elapsed(stage)
+    if 65 <= elapsed <= 78:
+        return STATS_TTL_PEAK
+    return STATS_TTL_LIVE
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry expiry (stats payloads, Gemini verdicts)"""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # {key: (payload, expires_at or None)}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                payload, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                del self._entries[key]
+            
+            self.misses += 1
+            return None
+
+    def put(self, key, payload, ttl):
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return round(self.hits / total * 100, 1) if total else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+stats_cache = TTLCache(STATS_CACHE_SIZE)
+
+
+# ============================================
+# 📡 Flashscore4 API Functions
+# ============================================
+def fetch_live_feed():
+    """Fetch the raw live tournament tree from Flashscore4 (None on error)"""
+    url = f"{RAPIDAPI_BASE_URL}/api/flashscore/v1/match/live/1"
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = rapidapi_get(url, timeout=30)
         response.raise_for_status()
         data = response.json()
         
-        # Flatten tournaments into matches
-        matches = []
         tournaments = data if isinstance(data, list) else []
-        
-        for tournament in tournaments:
-            league_name = tournament.get("name", "Unknown")
-            league_logo = tournament.get("image_path", "")
-            country = tournament.get("country_name", "")
-            
-            for match in tournament.get("matches", []):
-                match["league_name"] = league_name
-                match["league_logo"] = league_logo
-                match["country_name"] = country
-                matches.append(match)
-        
-        log_api(f"Fetched {len(matches)} live matches")
-        return matches
+        log_api(f"Fetched {sum(len(t.get('matches', [])) for t in tournaments)} live matches")
+        return data
     
     except requests.RequestException as e:
         log_error(f"API Error: {e}")
-        return []
+        return None
+
+
+def flatten_live_feed(data):
+    """Flatten tournaments into matches (league info copied onto each match)"""
+    matches = []
+    tournaments = data if isinstance(data, list) else []
+    
+    for tournament in tournaments:
+        league_name = tournament.get("name", "Unknown")
+        league_logo = tournament.get("image_path", "")
+        country = tournament.get("country_name", "")
+        
+        for match in tournament.get("matches", []):
+            matches.append(dict(match, league_name=league_name, league_logo=league_logo, country_name=country))
+    
+    return matches
+
+
+def fetch_live_matches():
+    """Fetch all live football matches from Flashscore4"""
+    return flatten_live_feed(fetch_live_feed())
 
 
 def fetch_match_stats(match_id):
     """Fetch detailed statistics for a specific match"""
-    url = f"https://{RAPIDAPI_HOST}/api/flashscore/v1/match/stats/{match_id}"
-    headers = {
-        "X-RapidAPI-Key": RAPIDAPI_KEY,
-        "X-RapidAPI-Host": RAPIDAPI_HOST
-    }
+    url = f"{RAPIDAPI_BASE_URL}/api/flashscore/v1/match/stats/{match_id}"
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = rapidapi_get(url, timeout=30)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -130,50 +389,142 @@ def fetch_match_stats(match_id):
         return None
 
 
-def parse_stats(stats_data):
-    """Parse match statistics into usable format"""
-    stats = {
-        "possession": {"home": 50, "away": 50},
-        "shots": {"home": 0, "away": 0},
-        "shots_on_target": {"home": 0, "away": 0},
-        "corners": {"home": 0, "away": 0},
-        "dangerous_attacks": {"home": 0, "away": 0},
-        "xG": {"home": 0, "away": 0}
-    }
+def fetch_match_stats_cached(match_id, stage=None):
+    """fetch_match_stats behind stats_cache; TTL is picked from the match stage"""
+    stats_data = stats_cache.get(match_id)
+    if stats_data is not None:
+        return stats_data
     
-    if not stats_data:
-        return stats
+    stats_data = fetch_match_stats(match_id)
+    if stats_data is not None:
+        stats_cache.put(match_id, stats_data, stats_ttl(stage))
+    return stats_data
+
+
+def parse_percent(value):
+    """'55%' / '55.5%' / 55 -> 55 (blank -> 50)"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value).rstrip("%").strip()
+    return int(float(text)) if text else 50
+
+
+def parse_count(value):
+    return int(value or 0)
+
+
+def parse_decimal(value):
+    return float(value or 0)
+
+
+# Exact Flashscore stat name -> (stats key, value parser)
+STAT_FIELDS = {
+    "ball possession": ("possession", parse_percent),
+    "total shots": ("shots", parse_count),
+    "shots on target": ("shots_on_target", parse_count),
+    "corner kicks": ("corners", parse_count),
+    "expected goals (xg)": ("xG", parse_decimal),
+    "big chances": ("dangerous_attacks", parse_count)
+}
+
+# Fallback for renamed/variant stat names, tried once per distinct name
+STAT_FIELD_PATTERNS = [
+    (re.compile(r"possession"), STAT_FIELDS["ball possession"]),
+    # Not "xG on target (xGOT)" / "Expected goals on target", which follow the real xG row
+    (re.compile(r"^(?!.*(?:on target|xgot)).*expected goals"), STAT_FIELDS["expected goals (xg)"]),
+    (re.compile(r"big chances"), STAT_FIELDS["big chances"])
+]
+
+# Flashscore period key -> parse_stats period name
+STAT_PERIODS = {"1st-half": "1st_half", "2nd-half": "2nd_half", "all-match": "all_match"}
+
+STAT_DEFAULTS = {
+    "possession": (50, 50),
+    "shots": (0, 0),
+    "shots_on_target": (0, 0),
+    "corners": (0, 0),
+    "dangerous_attacks": (0, 0),
+    "xG": (0, 0)
+}
+
+_stat_field_cache = {}  # Raw stat name -> (key, parser) or None
+
+
+def resolve_stat_field(name):
+    """Map a raw stat name to (stats key, parser); None for stats we don't use"""
+    try:
+        return _stat_field_cache[name]
+    except KeyError:
+        pass
+    
+    lowered = (name or "").lower()
+    field = STAT_FIELDS.get(lowered)
+    if field is None:
+        field = next((f for pattern, f in STAT_FIELD_PATTERNS if pattern.search(lowered)), None)
     
-    # Use 1st-half or all-match stats
-    stat_list = stats_data.get("1st-half", stats_data.get("all-match", []))
+    if len(_stat_field_cache) < 1024:  # Names come from a small fixed vocabulary
+        _stat_field_cache[name] = field
+    return field
+
+
+def parse_period(stat_list):
+    """One period's stat list -> {key: (home, away)}"""
+    values = dict(STAT_DEFAULTS)
+    cache = _stat_field_cache
     
     for stat in stat_list:
-        name = (stat.get("name") or "").lower()
-        home = stat.get("home_team", 0)
-        away = stat.get("away_team", 0)
-        
-        if "ball possession" in name:
-            stats["possession"]["home"] = int(str(home).replace("%", "") or 50)
-            stats["possession"]["away"] = int(str(away).replace("%", "") or 50)
-        elif name == "total shots":
-            stats["shots"]["home"] = int(home or 0)
-            stats["shots"]["away"] = int(away or 0)
-        elif name == "shots on target":
-            stats["shots_on_target"]["home"] = int(home or 0)
-            stats["shots_on_target"]["away"] = int(away or 0)
-        elif name == "corner kicks":
-            stats["corners"]["home"] = int(home or 0)
-            stats["corners"]["away"] = int(away or 0)
-        elif "expected goals" in name:
-            stats["xG"]["home"] = float(home or 0)
-            stats["xG"]["away"] = float(away or 0)
-        elif "big chances" in name:
-            stats["dangerous_attacks"]["home"] = int(home or 0)
-            stats["dangerous_attacks"]["away"] = int(away or 0)
+        name = stat.get("name")
+        field = cache[name] if name in cache else resolve_stat_field(name)
+        if field is not None:
+            key, parse = field
+            values[key] = (parse(stat.get("home_team", 0)), parse(stat.get("away_team", 0)))
     
+    return values
+
+
+def parse_match_stats(stats_data):
+    """Every period in a stats payload -> {period: {key: (home, away)}} (missing/empty periods omitted)"""
+    if not stats_data:
+        return {}
+    return {
+        period: parse_period(stats_data[raw])
+        for raw, period in STAT_PERIODS.items() if stats_data.get(raw)
+    }
+
+
+def expand_period(values):
+    return {key: {"home": home, "away": away} for key, (home, away) in values.items()}
+
+
+def parse_stats(stats_data):
+    """
+    Parse match statistics into usable format.
+    Top-level keys hold 1st-half stats (all-match if there is no 1st-half);
+    stats["periods"] keeps every period the payload carries in compact
+    {key: (home, away)} form, by name ("1st_half", "2nd_half", "all_match").
+    """
+    periods = parse_match_stats(stats_data)
+    
+    stats = expand_period(periods.get("1st_half") or periods.get("all_match") or STAT_DEFAULTS)
+    stats["periods"] = periods
     return stats
 
 
+def period_stats(stats, period):
+    """parse_stats-shaped stats for one period, falling back to the default period"""
+    values = stats.get("periods", {}).get(period) if period else None
+    return stats if values is None else expand_period(values)
+
+
+def period_total(stats, period, key):
+    """Home + away for one stat in one period, same fallback as period_stats"""
+    values = stats.get("periods", {}).get(period) if period else None
+    if values is None:
+        return stats[key]["home"] + stats[key]["away"]
+    home, away = values[key]
+    return home + away
+
+
 def parse_elapsed(stage):
     """Parse match time from stage field"""
     if not stage:
@@ -304,13 +655,185 @@ def scout_late_game_momentum(match, elapsed, stats):
 
 
 # ============================================
-# 🧠 Gemini AI Analyst
+# 🧮 Vectorized Scout Engine
 # ============================================
-def ask_gemini_analyst(candidate):
-    """Send match data to Gemini for final validation"""
+STAT_KEYS = ("possession", "shots", "shots_on_target", "corners", "dangerous_attacks", "xG")
+
+
+def load_scout_columns(rows, stat_keys=STAT_KEYS, period=None):
+    """Load (match, elapsed, stats) rows into one NumPy array per field (stats summed over both sides)"""
+    n = len(rows)
     
-    prompt = f"""Act as a Professional Football Analyst.
-STRATEGY: {candidate['strategy']} ({candidate['strategy_code']})
+    cols = {
+        "elapsed": np.fromiter((elapsed for _, elapsed, _ in rows), dtype=np.int64, count=n),
+        "home_score": np.fromiter(
+            (match.get("home_team", {}).get("score", 0) or 0 for match, _, _ in rows), dtype=np.int64, count=n
+        ),
+        "away_score": np.fromiter(
+            (match.get("away_team", {}).get("score", 0) or 0 for match, _, _ in rows), dtype=np.int64, count=n
+        )
+    }
+    for key in stat_keys:
+        cols[key] = np.fromiter(
+            (period_total(stats, period, key) for _, _, stats in rows),
+            dtype=np.float64 if key == "xG" else np.int64, count=n
+        )
+    
+    return cols
+
+
+def per_minute(cols, key):
+    """Column rate per elapsed minute (0 where elapsed is 0)"""
+    elapsed = cols["elapsed"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(elapsed > 0, cols[key] / elapsed, 0.0)
+
+
+def first_half_sniper_mask(cols):
+    """Vectorized scout_first_half_sniper: 15-40', 0-0, SoT >= 2 AND DA/min > 1.0"""
+    elapsed = cols["elapsed"]
+    return (
+        (elapsed >= 15) & (elapsed <= 40)
+        & (cols["home_score"] == 0) & (cols["away_score"] == 0)
+        & (cols["shots_on_target"] >= 2) & (per_minute(cols, "dangerous_attacks") > 1.0)
+    )
+
+
+def late_game_momentum_mask(cols):
+    """Vectorized scout_late_game_momentum: 60-85', diff <= 2, DA/min > 0.9 OR shots > 13 OR 65-78'"""
+    elapsed = cols["elapsed"]
+    return (
+        (elapsed >= 60) & (elapsed <= 85)
+        & (np.abs(cols["home_score"] - cols["away_score"]) <= 2)
+        & (
+            (per_minute(cols, "dangerous_attacks") > 0.9)
+            | (cols["shots"] > 13)
+            | ((elapsed >= 65) & (elapsed <= 78))
+        )
+    )
+
+
+def scout_batch(rows, strategies=None):
+    """
+    Run every registered strategy over many (match, elapsed, stats) rows at once.
+    Returns one candidate (or None) per row, identical to calling each
+    strategy's scout on each row in registration order.
+    Strategies with a vectorized mask are filtered as NumPy columns; candidate
+    dicts are only built for the rows that fired.
+    """
+    strategies = STRATEGIES if strategies is None else strategies
+    results = [None] * len(rows)
+    if not rows:
+        return results
+    
+    cols_by_period = {}  # Columns are loaded once per stats period the masks read
+    
+    for strategy in strategies:
+        period = strategy["period"]
+        if np is not None and strategy["mask"]:
+            if period not in cols_by_period:
+                needed = {key for s in strategies if s["period"] == period for key in s["stats"]}
+                cols_by_period[period] = load_scout_columns(rows, [key for key in STAT_KEYS if key in needed], period)
+            fired = np.flatnonzero(strategy["mask"](cols_by_period[period]))
+        else:
+            fired = [i for i, (match, elapsed, _) in enumerate(rows) if strategy_applies(strategy, match, elapsed)]
+        
+        for i in fired:
+            if results[i] is None:
+                match, elapsed, stats = rows[i]
+                results[i] = strategy["scout"](match, elapsed, period_stats(stats, period))
+    
+    return results
+
+
+# ============================================
+# 📋 Strategy Registry
+# ============================================
+STRATEGIES = []  # Evaluated in registration order; first strategy to fire wins
+
+
+def register_strategy(code, name, label, window, score_ok, stats, scout, mask=None, settle_by=None, period=None,
+                      breakpoints=()):
+    """
+    Declare a scout strategy.
+    - window: (first, last) minute the strategy can fire in
+    - score_ok: (home_score, away_score) -> bool, checked before stats are fetched
+    - stats: parse_stats keys the trigger reads (empty = no stats fetch needed)
+    - scout: (match, elapsed, stats) -> candidate dict or None
+    - mask: optional vectorized scout over load_scout_columns() output
+    - settle_by: last minute a goal still wins the bet (None = full time), used by replay
+    - period: stats period the scout reads ("1st_half", "2nd_half", "all_match"; None = parse_stats default)
+    - breakpoints: minutes inside the window where the trigger itself changes (a time-only
+      condition switching on); a match crossing one is re-evaluated even if nothing else moved
+    """
+    STRATEGIES.append({
+        "code": code,
+        "name": name,
+        "label": label,
+        "window": window,
+        "score_ok": score_ok,
+        "stats": tuple(stats),
+        "scout": scout,
+        "mask": mask,
+        "settle_by": settle_by,
+        "period": period,
+        "breakpoints": tuple(sorted(breakpoints))
+    })
+
+
+def strategy_applies(strategy, match, elapsed):
+    """Pre-filter: is the match inside the strategy's minute window and score shape?"""
+    start, end = strategy["window"]
+    if not start <= elapsed <= end:
+        return False
+    
+    home_score = match.get("home_team", {}).get("score", 0) or 0
+    away_score = match.get("away_team", {}).get("score", 0) or 0
+    return strategy["score_ok"](home_score, away_score)
+
+
+def eligible_strategies(match, elapsed):
+    return [strategy for strategy in STRATEGIES if strategy_applies(strategy, match, elapsed)]
+
+
+def strategy_by_code(code):
+    return next((strategy for strategy in STRATEGIES if strategy["code"] == code), None)
+
+
+CANDIDATE_STATS = ("shots", "shots_on_target", "corners", "dangerous_attacks", "xG")
+
+register_strategy(
+    code="IY_05",
+    name="First Half Sniper",
+    label="IY GOL",
+    window=(15, 40),
+    score_ok=lambda home, away: home == 0 and away == 0,
+    stats=CANDIDATE_STATS,
+    scout=scout_first_half_sniper,
+    mask=first_half_sniper_mask,
+    settle_by=45
+)
+
+register_strategy(
+    code="MS_GOL",
+    name="Late Game Momentum",
+    label="MS GOL",
+    window=(60, 85),
+    score_ok=lambda home, away: abs(home - away) <= 2,
+    stats=CANDIDATE_STATS,
+    scout=scout_late_game_momentum,
+    mask=late_game_momentum_mask,
+    period="all_match",  # Rates are per elapsed minute, so read whole-match totals
+    breakpoints=(65, 79)  # Peak goal window 65'-78' fires without any stat trigger
+)
+
+
+# ============================================
+# 🧠 Gemini AI Analyst
+# ============================================
+def format_candidate(candidate):
+    """Match/stat block shared by the single and batched prompts"""
+    return f"""STRATEGY: {candidate['strategy']} ({candidate['strategy_code']})
 MATCH: {candidate['home']} vs {candidate['away']}
 TIME: {candidate['minute']}' | SCORE: {candidate['score']}
 LEAGUE: {candidate['league']}
@@ -318,162 +841,1175 @@ STATS:
 - DA/min: {candidate['stats']['da_per_min']}
 - Shots (Total/Target): {candidate['stats']['total_shots']}/{candidate['stats']['shots_on_target']}
 - Corners: {candidate['stats']['corners']}
-- xG: {candidate['stats']['xG']}
+- xG: {candidate['stats']['xG']}"""
 
-Based on the stats, is a goal imminent?
-OUTPUT JSON ONLY:
-{{
-  "verdict": "PLAY" or "SKIP",
-  "confidence": (0-100),
-  "reason": "One short sentence."
-}}"""
 
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={GEMINI_API_KEY}"
+def call_gemini(prompt, max_tokens):
+    """POST a prompt to Gemini and return the JSON it answered with"""
+    url = f"{GEMINI_BASE_URL}/v1beta/models/gemini-pro:generateContent?key={GEMINI_API_KEY}"
     
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
             "temperature": 0.2,
-            "maxOutputTokens": 200
+            "maxOutputTokens": max_tokens
         }
     }
     
+    response = gemini_session.post(url, json=payload, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+    
+    # Extract text from response
+    text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "{}")
+    
+    # Parse JSON from response
+    # Clean up markdown formatting if present
+    text = text.strip()
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    text = text.strip()
+    
+    return json.loads(text)
+
+
+def ask_gemini_analyst(candidate):
+    """Send match data to Gemini for final validation"""
+    
+    prompt = f"""Act as a Professional Football Analyst.
+{format_candidate(candidate)}
+
+Based on the stats, is a goal imminent?
+OUTPUT JSON ONLY:
+{{
+  "verdict": "PLAY" or "SKIP",
+  "confidence": (0-100),
+  "reason": "One short sentence."
+}}"""
+
     try:
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        return call_gemini(prompt, 200)
+    except Exception as e:
+        log_warn(f"Gemini API error: {e}")
+        return {"verdict": "SKIP", "confidence": 0, "reason": "API error", "error": True}
+
+
+def ask_gemini_batch(candidates):
+    """
+    Validate many candidates with one Gemini call per GEMINI_BATCH_SIZE chunk.
+    Returns {match_id: result}. Candidates missing from an unparseable or
+    incomplete batch answer fall back to ask_gemini_analyst.
+    """
+    results = {}
+    
+    for i in range(0, len(candidates), GEMINI_BATCH_SIZE):
+        chunk = candidates[i:i + GEMINI_BATCH_SIZE]
         
-        # Extract text from response
-        text = data.get("candidates", [{}])[0].get("content", {}).get("parts", [{}])[0].get("text", "{}")
+        if len(chunk) == 1:
+            results[chunk[0]["match_id"]] = ask_gemini_analyst(chunk[0])
+            continue
         
-        # Parse JSON from response
-        # Clean up markdown formatting if present
-        text = text.strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        if text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
+        blocks = "\n\n".join(
+            f"[MATCH_ID: {candidate['match_id']}]\n{format_candidate(candidate)}"
+            for candidate in chunk
+        )
+        prompt = f"""Act as a Professional Football Analyst.
+Evaluate each of the {len(chunk)} matches below independently.
+
+{blocks}
+
+For each match, based on its stats, is a goal imminent?
+OUTPUT A JSON ARRAY ONLY, one object per MATCH_ID:
+[
+  {{
+    "match_id": "<MATCH_ID>",
+    "verdict": "PLAY" or "SKIP",
+    "confidence": (0-100),
+    "reason": "One short sentence."
+  }}
+]"""
+
+        answered = {}
+        try:
+            verdicts = call_gemini(prompt, 120 * len(chunk))
+            if isinstance(verdicts, list):
+                for verdict in verdicts:
+                    if isinstance(verdict, dict) and "match_id" in verdict:
+                        answered[str(verdict["match_id"])] = verdict
+        except Exception as e:
+            log_warn(f"Gemini batch error ({len(chunk)} candidates): {e}")
         
-        result = json.loads(text)
-        return result
+        for candidate in chunk:
+            result = answered.get(str(candidate["match_id"]))
+            if result is None:
+                result = ask_gemini_analyst(candidate)
+            results[candidate["match_id"]] = result
     
-    except Exception as e:
-        log_warn(f"Gemini API error: {e}")
-        return {"verdict": "SKIP", "confidence": 0, "reason": "API error"}
+    return results
+
+
+# Bucket width per candidate stat in the verdict fingerprint
+VERDICT_STAT_BUCKETS = {
+    "total_shots": 2,
+    "shots_on_target": 1,
+    "da_per_min": 0.2,
+    "corners": 2,
+    "xG": 0.25
+}
+
+
+def candidate_fingerprint(candidate):
+    """Quantized (match, strategy, score, minute bucket, stat buckets) - rescans of a match that barely moved share a verdict"""
+    stats = candidate.get("stats", {})
+    return (
+        candidate["match_id"],
+        candidate["strategy_code"],
+        candidate["score"],
+        candidate["minute"] // VERDICT_MINUTE_BUCKET,
+        tuple(int((stats.get(key) or 0) // width) for key, width in VERDICT_STAT_BUCKETS.items())
+    )
+
+
+verdict_cache = TTLCache(VERDICT_CACHE_SIZE)
+verdicts_in_flight = {}  # {fingerprint: Future} for calls another thread is already making
+verdicts_lock = threading.Lock()
+
+
+def ask_gemini_cached(candidates):
+    """
+    ask_gemini_batch behind verdict_cache: returns {match_id: result}.
+    Fingerprints already cached are answered locally, ones another call is
+    currently asking about wait for that answer, and only the rest go to Gemini.
+    API errors are never cached.
+    """
+    results = {}
+    owned = []  # (candidate, fingerprint, future) this call asks Gemini about
+    waiting = []  # (candidate, future) answered by another call
+    
+    with verdicts_lock:
+        for candidate in candidates:
+            fingerprint = candidate_fingerprint(candidate)
+            cached = verdict_cache.get(fingerprint)
+            if cached is not None:
+                results[candidate["match_id"]] = cached
+                continue
+            
+            future = verdicts_in_flight.get(fingerprint)
+            if future is None:
+                future = verdicts_in_flight[fingerprint] = Future()
+                owned.append((candidate, fingerprint, future))
+            else:
+                waiting.append((candidate, future))
+    
+    answered = {}
+    try:
+        if owned:
+            answered = ask_gemini_batch([candidate for candidate, _, _ in owned])
+    finally:
+        for candidate, fingerprint, future in owned:
+            result = answered.get(candidate["match_id"]) or {
+                "verdict": "SKIP", "confidence": 0, "reason": "No verdict", "error": True
+            }
+            if not result.get("error"):
+                verdict_cache.put(fingerprint, result, VERDICT_CACHE_TTL)
+            with verdicts_lock:
+                verdicts_in_flight.pop(fingerprint, None)
+            future.set_result(result)
+            results[candidate["match_id"]] = result
+    
+    for candidate, future in waiting:
+        results[candidate["match_id"]] = future.result()
+    
+    return results
+
+
+signal_print_lock = threading.Lock()  # Keeps multi-line signal blocks from interleaving
+
+
+def handle_verdict(candidate, gemini_result):
+    """Print the signal (and start the cooldown) if Gemini says PLAY; returns True on alert"""
+    verdict = gemini_result.get("verdict", "SKIP")
+    confidence = gemini_result.get("confidence", 0)
+    reason = gemini_result.get("reason", "No reason provided")
+    
+    # Alert if PLAY and confidence > 75
+    if verdict == "PLAY" and confidence > 75:
+        if not cooldowns.claim(candidate["match_id"]):
+            log_info(f"Already alerted: {candidate['home']} vs {candidate['away']}")
+            return False
+        
+        strategy = strategy_by_code(candidate["strategy_code"])
+        strategy_label = strategy["label"] if strategy else candidate["strategy_code"]
+        
+        with signal_print_lock:
+            print()
+            print(f"{Colors.GREEN}{Colors.BOLD}{'='*60}{Colors.END}")
+            log_signal(f"[{strategy_label}] {candidate['home']} vs {candidate['away']}")
+            print(f"   Time: {candidate['minute']}' | Score: {candidate['score']} | League: {candidate['league']}")
+            print(f"   Shots: {candidate['stats']['total_shots']} | SoT: {candidate['stats']['shots_on_target']} | xG: {candidate['stats']['xG']}")
+            print(f"   Confidence: {Colors.GREEN}{confidence}%{Colors.END}")
+            print(f"   Reason: {reason}")
+            print(f"{Colors.GREEN}{Colors.BOLD}{'='*60}{Colors.END}")
+            print()
+        return True
+    
+    log_info(f"❌ Skipped: {candidate['home']} vs {candidate['away']} (Conf: {confidence}%)")
+    return False
 
 
 # ============================================
 # 🚦 Cooldown Check
 # ============================================
+class CooldownStore:
+    """
+    Alerted match_ids and when their cooldown ends.
+    Held in memory for lookups and written through to SQLite, so a restart
+    during a busy window doesn't re-alert everything. Expired entries are
+    dropped from memory and disk, keeping both flat over long uptimes.
+    With shared=True every lookup goes to SQLite, so several processes
+    using the same file see each other's cooldowns.
+    """
+
+    PRUNE_EVERY = 60  # Seconds between expiry sweeps
+
+    def __init__(self, path, minutes, shared=False):
+        self.cooldown = minutes * 60
+        self.shared = shared
+        self._until = {}  # {match_id: cooldown end (epoch seconds)}
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._db = None
+        
+        if path:
+            try:
+                self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS cooldowns (match_id TEXT PRIMARY KEY, until REAL NOT NULL)"
+                )
+                self._load()
+            except sqlite3.Error as e:
+                log_warn(f"Cooldown store unavailable ({e}), keeping cooldowns in memory only")
+                self._db = None
+
+    def _load(self):
+        now = time.time()
+        with self._db:
+            self._db.execute("DELETE FROM cooldowns WHERE until <= ?", (now,))
+        self._until = dict(self._db.execute("SELECT match_id, until FROM cooldowns"))
+        self._last_prune = now
+
+    def _prune(self, now):
+        self._until = {match_id: until for match_id, until in self._until.items() if until > now}
+        if self._db is not None:
+            with self._db:
+                self._db.execute("DELETE FROM cooldowns WHERE until <= ?", (now,))
+        self._last_prune = now
+
+    def active(self, match_ids):
+        """The subset of match_ids still on cooldown (one call per scan)"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_prune >= self.PRUNE_EVERY:
+                self._prune(now)
+            if self.shared and self._db is not None:
+                return self._active_shared(match_ids, now)
+            until = self._until
+            return {match_id for match_id in match_ids if until.get(str(match_id), 0) > now}
+
+    def _active_shared(self, match_ids, now):
+        by_key = {str(match_id): match_id for match_id in match_ids}
+        keys = list(by_key)
+        active = set()
+        
+        for i in range(0, len(keys), 500):  # Stay under SQLite's bound-parameter limit
+            chunk = keys[i:i + 500]
+            rows = self._db.execute(
+                f"SELECT match_id FROM cooldowns WHERE until > ? AND match_id IN ({','.join('?' * len(chunk))})",
+                (now, *chunk)
+            )
+            active.update(by_key[key] for key, in rows)
+        
+        return active
+
+    def claim(self, match_id):
+        """
+        Start the cooldown unless one is already running.
+        Returns False if another scan (or, shared, another process) got there
+        first - the caller must not alert.
+        """
+        key = str(match_id)
+        now = time.time()
+        until = now + self.cooldown
+        
+        with self._lock:
+            if self.shared and self._db is not None:
+                with self._db:
+                    claimed = self._db.execute(
+                        "INSERT INTO cooldowns (match_id, until) VALUES (?, ?) "
+                        "ON CONFLICT(match_id) DO UPDATE SET until = excluded.until WHERE cooldowns.until <= ?",
+                        (key, until, now)
+                    ).rowcount == 1
+            else:
+                claimed = self._until.get(key, 0) <= now
+                if claimed and self._db is not None:
+                    with self._db:
+                        self._db.execute(
+                            "INSERT OR REPLACE INTO cooldowns (match_id, until) VALUES (?, ?)", (key, until)
+                        )
+            
+            if claimed:
+                self._until[key] = until
+            return claimed
+
+    def set(self, match_id):
+        until = time.time() + self.cooldown
+        with self._lock:
+            self._until[str(match_id)] = until
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO cooldowns (match_id, until) VALUES (?, ?)", (str(match_id), until)
+                    )
+
+    def clear(self):
+        with self._lock:
+            self._until.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM cooldowns")
+
+    def __len__(self):
+        return len(self._until)
+
+
+cooldowns = CooldownStore(COOLDOWN_DB, COOLDOWN_MINUTES)
+
+
 def is_on_cooldown(match_id):
-    """Check if match is on cooldown (alerted in last 15 mins)"""
-    if match_id not in alert_history:
-        return False
-    
-    last_alert = alert_history[match_id]
-    cooldown_end = last_alert + timedelta(minutes=COOLDOWN_MINUTES)
-    
-    return datetime.now() < cooldown_end
+    """Check if match is on cooldown (alerted in the last COOLDOWN_MINUTES)"""
+    return bool(cooldowns.active([match_id]))
 
 
 def set_cooldown(match_id):
     """Set cooldown for a match"""
-    alert_history[match_id] = datetime.now()
+    cooldowns.set(match_id)
 
 
 # ============================================
-# 🔄 Main Scan Loop
+# 🗂️ Live Feed Snapshots
 # ============================================
-def run_scan():
-    """Execute one scan cycle"""
-    matches = fetch_live_matches()
-    
-    if not matches:
-        log_info("No live matches found")
-        return 0
+class MatchSnapshotStore:
+    """
+    Last evaluated state per match_id.
+    A match is only re-evaluated when something the strategies care about
+    moved - the score, the set of eligible strategies, or the elapsed time
+    crossing one of an eligible strategy's breakpoints - or when its snapshot
+    is older than `stale_after` seconds. The raw minute alone ticks every scan,
+    so it is deliberately not part of the state.
+    """
+
+    def __init__(self, stale_after):
+        self.stale_after = stale_after
+        self._snapshots = {}  # {match_id: (state_key, recorded_at)}
+
+    @staticmethod
+    def state_key(match):
+        elapsed = parse_elapsed(match.get("stage"))
+        return (
+            match.get("home_team", {}).get("score", 0) or 0,
+            match.get("away_team", {}).get("score", 0) or 0,
+            tuple(
+                (strategy["code"], bisect.bisect_right(strategy["breakpoints"], elapsed))
+                for strategy in eligible_strategies(match, elapsed)
+            )
+        )
+
+    def has_changed(self, match):
+        """True if the match moved (or went stale) since it was last recorded"""
+        snapshot = self._snapshots.get(match.get("match_id"))
+        if snapshot is None:
+            return True
+        
+        state_key, recorded_at = snapshot
+        if state_key != self.state_key(match):
+            return True
+        return time.monotonic() - recorded_at > self.stale_after
+
+    def record(self, match):
+        """Remember the state the match was just evaluated in"""
+        self._snapshots[match.get("match_id")] = (self.state_key(match), time.monotonic())
+
+    def prune(self, live_ids):
+        """Forget matches that dropped out of the live feed"""
+        for match_id in list(self._snapshots):
+            if match_id not in live_ids:
+                del self._snapshots[match_id]
+
+    def __len__(self):
+        return len(self._snapshots)
+
+
+match_snapshots = MatchSnapshotStore(SNAPSHOT_STALE_SECONDS)
+
+
+# ============================================
+# ⏱️ Poll Scheduler
+# ============================================
+class PollScheduler:
+    """
+    Picks the next poll delay from the current live set:
+    - POLL_MIN_INTERVAL while any match sits inside a strategy window
+    - just long enough to catch a match entering a window within POLL_LEAD_MINUTES
+    - POLL_IDLE_INTERVAL when nothing is live
+    The result is never shorter than what the remaining daily budget allows.
+    """
+
+    def __init__(self, usage, daily_budget):
+        self.usage = usage
+        self.daily_budget = daily_budget
+        self.requests_per_scan = 1.0  # Running average, seeded with the live-feed call
+        self._elapsed = []
+
+    def observe_live(self, matches):
+        """Remember where every live match is (called once per scan)"""
+        self._elapsed = [parse_elapsed(match.get("stage")) for match in matches]
+
+    def observe_scan(self, requests_used):
+        """Fold one scan's request count into the running average"""
+        self.requests_per_scan = 0.7 * self.requests_per_scan + 0.3 * max(1, requests_used)
+
+    def desired_interval(self):
+        """Interval the live set asks for, ignoring the budget"""
+        if not self._elapsed:
+            return POLL_IDLE_INTERVAL
+        
+        lead = None
+        for elapsed in self._elapsed:
+            for start, end in (strategy["window"] for strategy in STRATEGIES):
+                if start <= elapsed <= end:
+                    return POLL_MIN_INTERVAL
+                if 0 < start - elapsed <= POLL_LEAD_MINUTES:
+                    lead = min(lead or start - elapsed, start - elapsed)
+        
+        if lead is not None:
+            return max(POLL_MIN_INTERVAL, min(POLL_INTERVAL, lead * 60))
+        return POLL_INTERVAL
+
+    @staticmethod
+    def seconds_until_midnight():
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return max(1, (midnight - now).total_seconds())
+
+    def budget_interval(self):
+        """Shortest interval that still fits the remaining budget into today"""
+        remaining = self.daily_budget - self.usage.today()
+        seconds_left = self.seconds_until_midnight()
+        
+        if remaining < self.requests_per_scan:
+            return seconds_left  # Budget spent - wait for the reset
+        return seconds_left / (remaining / self.requests_per_scan)
+
+    def next_interval(self):
+        return int(max(self.desired_interval(), self.budget_interval()))
+
+    def report(self, interval):
+        """(spent today, projected end-of-day total) if polling stays at `interval`"""
+        spent = self.usage.today()
+        scans_left = self.seconds_until_midnight() / max(1, interval)
+        projected = spent + int(scans_left * self.requests_per_scan)
+        return spent, min(projected, max(spent, self.daily_budget))
+
+
+poll_scheduler = PollScheduler(rapidapi_usage, DAILY_REQUEST_BUDGET)
+
+
+# ============================================
+# 📼 Feed Recorder
+# ============================================
+class FeedRecorder:
+    """Writes each scan's raw live feed + stats payloads to a gzipped JSON snapshot"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def save(self, live_feed, stats_by_id):
+        if not self.directory or live_feed is None:
+            return None
+        
+        now = datetime.now()
+        path = os.path.join(self.directory, f"scan-{now.strftime('%Y%m%d-%H%M%S-%f')}.json.gz")
+        snapshot = {
+            "ts": now.timestamp(),
+            "live": live_feed,
+            "stats": {str(match_id): data for match_id, data in stats_by_id.items() if data is not None}
+        }
+        
+        try:
+            tmp_path = path + ".tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            return path
+        except OSError as e:
+            log_warn(f"Snapshot write failed: {e}")
+            return None
+
+
+feed_recorder = FeedRecorder(RECORD_DIR)
+
+
+# ============================================
+# 🔁 Replay / Backtest
+# ============================================
+def replay_snapshot(path):
+    """
+    Worker: scout one recorded snapshot offline.
+    Returns (ts, [[match_id, elapsed, total_goals, fired strategy_code or None, candidate stats or None], ...])
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        snapshot = json.load(f)
     
-    candidates_found = 0
-    alerts_sent = 0
+    stats_payloads = snapshot.get("stats", {})
+    states = []
+    rows = []
+    row_states = []
     
-    for match in matches:
-        match_id = match.get("match_id")
+    for match in flatten_live_feed(snapshot.get("live")):
+        match_id = str(match.get("match_id"))
         elapsed = parse_elapsed(match.get("stage"))
-        
-        # Check if candidate for either strategy
         home_score = match.get("home_team", {}).get("score", 0) or 0
         away_score = match.get("away_team", {}).get("score", 0) or 0
-        goal_diff = abs(home_score - away_score)
         
-        # Quick filter before fetching stats
-        is_iy_candidate = 15 <= elapsed <= 40 and home_score == 0 and away_score == 0
-        is_ms_candidate = 60 <= elapsed <= 85 and goal_diff <= 2
+        state = [match_id, elapsed, home_score + away_score, None, None]
+        states.append(state)
         
-        if not (is_iy_candidate or is_ms_candidate):
-            continue
+        # Only matches the live bot actually fetched stats for can fire
+        if match_id in stats_payloads and eligible_strategies(match, elapsed):
+            rows.append((match, elapsed, parse_stats(stats_payloads[match_id])))
+            row_states.append(state)
+    
+    for state, candidate in zip(row_states, scout_batch(rows)):
+        if candidate:
+            state[3] = candidate["strategy_code"]
+            state[4] = candidate["stats"]
+    
+    return snapshot.get("ts", 0), states
+
+
+def settle_signals(snapshots):
+    """
+    Yield (strategy_code, candidate stats, outcome) for the first signal per (match, strategy).
+    A signal hits (True) if the total goals rise by the strategy's settle_by minute, misses
+    (False) once the match is past that minute (or left the feed), and stays open (None) otherwise.
+    """
+    last_index = len(snapshots) - 1
+    timelines = {}  # {match_id: [(snapshot_index, elapsed, goals, code, stats), ...]}
+    
+    for index, (_, states) in enumerate(snapshots):
+        for match_id, elapsed, goals, code, stats in states:
+            timelines.setdefault(match_id, []).append((index, elapsed, goals, code, stats))
+    
+    for timeline in timelines.values():
+        signalled = set()
         
-        # Skip if on cooldown
-        if is_on_cooldown(match_id):
-            continue
+        for pos, (_, _, goals, code, stats) in enumerate(timeline):
+            strategy = strategy_by_code(code) if code is not None else None
+            if strategy is None or code in signalled:
+                continue
+            signalled.add(code)
+            
+            settle_by = strategy["settle_by"]
+            later = timeline[pos + 1:]
+            
+            if any(g > goals and (settle_by is None or el <= settle_by) for _, el, g, _, _ in later):
+                yield code, stats, True
+            elif timeline[-1][0] < last_index or (
+                settle_by is not None and any(el > settle_by for _, el, _, _, _ in later)
+            ):
+                yield code, stats, False
+            else:
+                yield code, stats, None
+
+
+def settle_replay(snapshots):
+    """Per-strategy signal/hit/miss/open tally over settle_signals"""
+    report = {
+        strategy["code"]: {"name": strategy["name"], "signals": 0, "hits": 0, "misses": 0, "open": 0}
+        for strategy in STRATEGIES
+    }
+    
+    for code, _, outcome in settle_signals(snapshots):
+        tally = report[code]
+        tally["signals"] += 1
+        tally["hits" if outcome else "open" if outcome is None else "misses"] += 1
+    
+    for tally in report.values():
+        settled = tally["hits"] + tally["misses"]
+        tally["hit_rate"] = round(tally["hits"] / settled * 100, 1) if settled else 0.0
+    
+    return report
+
+
+def load_replay(directory, workers=None):
+    """Scout every recorded snapshot in `directory` across worker processes, oldest first"""
+    files = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".json.gz")
+    )
+    if not files:
+        return []
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        snapshots = list(pool.map(replay_snapshot, files, chunksize=max(1, len(files) // 64)))
+    snapshots.sort(key=lambda snapshot: snapshot[0])
+    return snapshots
+
+
+def run_replay(directory, workers=None):
+    """Replay every recorded snapshot in `directory` across worker processes"""
+    started = time.monotonic()
+    snapshots = load_replay(directory, workers)
+    if not snapshots:
+        log_warn(f"No snapshots found in {directory}")
+        return {}
+    
+    report = settle_replay(snapshots)
+    
+    recorded = snapshots[-1][0] - snapshots[0][0]
+    took = time.monotonic() - started
+    log_info(f"Replayed {len(snapshots)} snapshots ({recorded / 60:.0f} min of feed) in {took:.1f}s")
+    for tally in report.values():
+        log_info(
+            f"{tally['name']}: {tally['signals']} signal(s) | "
+            f"{tally['hits']} hit / {tally['misses']} miss / {tally['open']} open | "
+            f"hit rate {tally['hit_rate']}%"
+        )
+    
+    return report
+
+
+# ============================================
+# 🧪 Local Pre-Screen Model
+# ============================================
+PRESCREEN_FEATURES = ("total_shots", "shots_on_target", "da_per_min", "corners", "xG")  # candidate["stats"] keys
+
+
+class PreScreen:
+    """
+    Logistic model over candidate["stats"] (plus a per-strategy offset),
+    trained offline by `train`. Confident SKIPs/PLAYs are answered locally;
+    only candidates between the two thresholds are sent to Gemini.
+    """
+
+    def __init__(self, path, skip_below, play_above):
+        self.skip_below = skip_below
+        self.play_above = play_above
+        self.model = None
+        self.counts = {"scored": 0, "local_skip": 0, "local_play": 0, "to_gemini": 0}
+        self._lock = threading.Lock()
+        
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.model = json.load(f)
+            except (OSError, ValueError) as e:
+                log_warn(f"Pre-screen model not loaded ({e}), every candidate goes to Gemini")
+
+    def score(self, candidate):
+        """Goal probability for a candidate (None without a model)"""
+        model = self.model
+        if model is None:
+            return None
+        
+        stats = candidate.get("stats", {})
+        z = model["bias"] + model["strategy_offsets"].get(candidate["strategy_code"], 0.0)
+        for key, weight, mean, scale in zip(model["features"], model["weights"], model["mean"], model["scale"]):
+            z += weight * ((stats.get(key) or 0) - mean) / scale
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def verdict(self, candidate):
+        """A local Gemini-shaped verdict, or None when the candidate needs Gemini"""
+        probability = self.score(candidate)
+        if probability is None:
+            return None
+        
+        confidence = int(round(probability * 100))
+        if probability < self.skip_below:
+            decision, counter = "SKIP", "local_skip"
+        elif probability > self.play_above:
+            decision, counter = "PLAY", "local_play"
+        else:
+            decision, counter = None, "to_gemini"
+        
+        with self._lock:
+            self.counts["scored"] += 1
+            self.counts[counter] += 1
         
-        # Fetch detailed stats
-        stats_data = fetch_match_stats(match_id)
-        stats = parse_stats(stats_data)
+        if decision is None:
+            return None
+        return {"verdict": decision, "confidence": confidence, "reason": f"Local model: {confidence}% goal probability"}
+
+    def report(self):
+        counts = dict(self.counts)
+        skipped = counts["local_skip"] + counts["local_play"]
+        share = round(skipped / counts["scored"] * 100, 1) if counts["scored"] else 0.0
+        return counts, skipped, share
+
+
+prescreen = PreScreen(PRESCREEN_MODEL, PRESCREEN_SKIP_BELOW, PRESCREEN_PLAY_ABOVE)
+
+
+def fit_logistic(X, y, l2=1.0, iterations=2000, learning_rate=0.5):
+    """L2-regularised logistic regression by batch gradient descent (NumPy, CPU)"""
+    n, d = X.shape
+    base_rate = min(max(y.mean(), 1e-3), 1 - 1e-3)
+    weights = np.zeros(d)
+    bias = math.log(base_rate / (1 - base_rate))
+    
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(X @ weights + bias)))
+        weights -= learning_rate * (X.T @ (p - y) + l2 * weights) / n
+        bias -= learning_rate * float((p - y).mean())
+    
+    return weights, bias
+
+
+def train_prescreen(directory, path=PRESCREEN_MODEL, workers=None):
+    """Fit the pre-screen model on every settled signal replayed from `directory` and save it as JSON"""
+    if np is None:
+        log_error("Training the pre-screen model needs numpy")
+        return None
+    
+    snapshots = load_replay(directory, workers)
+    examples = [(code, stats, outcome) for code, stats, outcome in settle_signals(snapshots) if outcome is not None]
+    if len(examples) < 20:
+        log_warn(f"Only {len(examples)} settled signal(s) in {directory}; record more scans before training")
+        return None
+    
+    codes = [strategy["code"] for strategy in STRATEGIES]
+    stats_columns = np.array(
+        [[float(stats.get(key) or 0) for key in PRESCREEN_FEATURES] for _, stats, _ in examples]
+    )
+    mean = stats_columns.mean(axis=0)
+    scale = stats_columns.std(axis=0)
+    scale[scale == 0] = 1.0
+    
+    # Standardised stats + one indicator column per strategy (its fitted weight is the offset)
+    indicators = np.array([[1.0 if code == c else 0.0 for c in codes] for code, _, _ in examples])
+    X = np.hstack([(stats_columns - mean) / scale, indicators])
+    y = np.array([1.0 if outcome else 0.0 for _, _, outcome in examples])
+    
+    weights, bias = fit_logistic(X, y)
+    n_stats = len(PRESCREEN_FEATURES)
+    model = {
+        "features": list(PRESCREEN_FEATURES),
+        "mean": mean.tolist(),
+        "scale": scale.tolist(),
+        "weights": weights[:n_stats].tolist(),
+        "strategy_offsets": dict(zip(codes, weights[n_stats:].tolist())),
+        "bias": bias,
+        "examples": len(examples),
+        "base_rate": round(float(y.mean()), 4),
+        "trained_at": datetime.now().isoformat(timespec="seconds")
+    }
+    
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(model, f, indent=2)
+    os.replace(tmp_path, path)
+    
+    # How the saved model would have routed its own training signals
+    screen = PreScreen(path, PRESCREEN_SKIP_BELOW, PRESCREEN_PLAY_ABOVE)
+    probabilities = [screen.score({"strategy_code": code, "stats": stats}) for code, stats, _ in examples]
+    accuracy = sum((p >= 0.5) == bool(label) for p, label in zip(probabilities, y)) / len(examples)
+    local = sum(1 for p in probabilities if p < PRESCREEN_SKIP_BELOW or p > PRESCREEN_PLAY_ABOVE)
+    log_success(f"Pre-screen model saved to {path} ({len(examples)} settled signals, base rate {model['base_rate']:.0%})")
+    log_info(f"Training accuracy {accuracy:.0%} | {local}/{len(examples)} would skip Gemini at the current thresholds")
+    return model
+
+
+# ============================================
+# 🚰 Scan Pipeline
+# ============================================
+PIPELINE_DONE = object()  # End-of-stream marker passed down the stage queues
+
+
+def stats_stage(shortlist, rows_out, stats_by_id):
+    """
+    Fetch stats with at most STATS_MAX_INFLIGHT requests in flight and emit a
+    (match, elapsed, stats) row the moment each one lands. New fetches are only
+    started once a finished row has been handed downstream, so a full queue
+    holds the stage back instead of piling up payloads.
+    """
+    pending = iter(shortlist)
+    in_flight = {}
+    
+    with ThreadPoolExecutor(max_workers=max(1, STATS_MAX_INFLIGHT)) as pool:
+        while True:
+            for entry in pending:
+                match, elapsed, strategies = entry
+                if not any(strategy["stats"] for strategy in strategies):
+                    rows_out.put((match, elapsed, parse_stats(None)))
+                    continue
+                
+                future = pool.submit(fetch_match_stats_cached, match.get("match_id"), match.get("stage"))
+                in_flight[future] = entry
+                if len(in_flight) >= STATS_MAX_INFLIGHT:
+                    break
+            
+            if not in_flight:
+                return
+            
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                match, elapsed, _ = in_flight.pop(future)
+                try:
+                    stats_data = future.result()
+                except Exception as e:
+                    log_error(f"Stats fetch error for {match.get('match_id')}: {e}")
+                    stats_data = None
+                
+                stats_by_id[match.get("match_id")] = stats_data
+                rows_out.put((match, elapsed, parse_stats(stats_data)))
+
+
+def scout_stage(rows_in, candidates_out, on_verdict, on_no_candidate):
+    """
+    Scout whatever rows have arrived as one batch. Candidates the pre-screen
+    model is sure about are settled here; the rest are emitted for Gemini.
+    """
+    while True:
+        rows = [rows_in.get()]
+        while True:
+            try:
+                rows.append(rows_in.get_nowait())
+            except queue.Empty:
+                break
+        
+        finished = rows[-1] is PIPELINE_DONE
+        rows = [row for row in rows if row is not PIPELINE_DONE]
+        
+        try:
+            for (match, _, _), candidate in zip(rows, scout_batch(rows)):
+                if not candidate:
+                    on_no_candidate(match)
+                    continue
+                local = prescreen.verdict(candidate)
+                if local is not None:
+                    on_verdict(candidate, local)
+                else:
+                    candidates_out.put(candidate)
+        except Exception as e:
+            log_error(f"Scout error ({len(rows)} rows): {e}")
         
-        # Run scout filters
-        candidate = None
+        if finished:
+            return
+
+
+def gemini_stage(candidates_in, on_verdict):
+    """Validate the next candidate plus any already queued (up to GEMINI_BATCH_SIZE) per call"""
+    while True:
+        candidate = candidates_in.get()
+        if candidate is PIPELINE_DONE:
+            return
         
-        if is_iy_candidate:
-            candidate = scout_first_half_sniper(match, elapsed, stats)
+        chunk = [candidate]
+        finished = False
+        while len(chunk) < GEMINI_BATCH_SIZE:
+            try:
+                candidate = candidates_in.get_nowait()
+            except queue.Empty:
+                break
+            if candidate is PIPELINE_DONE:
+                finished = True
+                break
+            chunk.append(candidate)
         
-        if not candidate and is_ms_candidate:
-            candidate = scout_late_game_momentum(match, elapsed, stats)
+        log_info(f"🧠 Analyzing {len(chunk)} candidate(s)...")
+        try:
+            verdicts = ask_gemini_cached(chunk)
+            for candidate in chunk:
+                on_verdict(candidate, verdicts[candidate["match_id"]])
+        except Exception as e:
+            log_error(f"Gemini stage error ({len(chunk)} candidates): {e}")
         
-        if not candidate:
+        if finished:
+            return
+
+
+def run_scan_pipeline(shortlist):
+    """
+    Run a shortlist through stats -> scout -> Gemini with every stage working
+    at once. Returns (candidates, alerts, {match_id: raw stats payload}).
+    """
+    rows = queue.Queue(PIPELINE_QUEUE_SIZE)
+    candidates = queue.Queue(PIPELINE_QUEUE_SIZE)
+    stats_by_id = {}
+    counts = {"candidates": 0, "alerts": 0}
+    counts_lock = threading.Lock()
+    gemini_workers = max(1, GEMINI_WORKERS)
+    
+    matches_by_id = {match.get("match_id"): match for match, _, _ in shortlist}
+    
+    # A match is only marked evaluated once it has a real answer: failed stats
+    # fetches and Gemini errors are retried next scan, not after the snapshot goes stale
+    def on_no_candidate(match):
+        match_id = match.get("match_id")
+        if match_id not in stats_by_id or stats_by_id[match_id] is not None:
+            match_snapshots.record(match)
+    
+    def on_verdict(candidate, result):
+        alerted = handle_verdict(candidate, result)
+        if not result.get("error"):
+            match_snapshots.record(matches_by_id[candidate["match_id"]])
+        with counts_lock:
+            counts["candidates"] += 1
+            counts["alerts"] += 1 if alerted else 0
+    
+    def run_stats():
+        try:
+            stats_stage(shortlist, rows, stats_by_id)
+        except Exception as e:
+            log_error(f"Stats stage error: {e}")
+        finally:
+            rows.put(PIPELINE_DONE)
+    
+    def run_scout():
+        try:
+            scout_stage(rows, candidates, on_verdict, on_no_candidate)
+        finally:
+            for _ in range(gemini_workers):
+                candidates.put(PIPELINE_DONE)  # One end marker per Gemini worker
+    
+    threads = [threading.Thread(target=run_stats, daemon=True), threading.Thread(target=run_scout, daemon=True)]
+    threads += [
+        threading.Thread(target=gemini_stage, args=(candidates, on_verdict), daemon=True)
+        for _ in range(gemini_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    return counts["candidates"], counts["alerts"], stats_by_id
+
+
+# ============================================
+# 🔄 Main Scan Loop
+# ============================================
+def run_scan():
+    """Execute one scan cycle"""
+    live_feed = fetch_live_feed()
+    matches = flatten_live_feed(live_feed)
+    poll_scheduler.observe_live(matches)
+    
+    if not matches:
+        log_info("No live matches found")
+        return 0, 0
+    
+    return scan_matches(matches, live_feed)
+
+
+def scan_matches(matches, live_feed=None):
+    """Evaluate already-fetched live matches: returns (candidates, alerts)"""
+    unchanged = 0
+    shortlist = []
+    
+    for match in matches:
+        # Nothing moved since the last evaluation - same verdict as before
+        if not match_snapshots.has_changed(match):
+            unchanged += 1
             continue
         
-        candidates_found += 1
+        elapsed = parse_elapsed(match.get("stage"))
         
-        # Send to Gemini for validation
-        log_info(f"🧠 Analyzing: {candidate['home']} vs {candidate['away']}")
-        gemini_result = ask_gemini_analyst(candidate)
+        # Quick filter before fetching stats: can any registered strategy fire?
+        strategies = eligible_strategies(match, elapsed)
+        if not strategies:
+            match_snapshots.record(match)
+            continue
         
-        verdict = gemini_result.get("verdict", "SKIP")
-        confidence = gemini_result.get("confidence", 0)
-        reason = gemini_result.get("reason", "No reason provided")
+        shortlist.append((match, elapsed, strategies))
+    
+    # Skip matches on cooldown (one batched lookup for the whole shortlist)
+    on_cooldown = cooldowns.active([match.get("match_id") for match, _, _ in shortlist])
+    if on_cooldown:
+        shortlist = [entry for entry in shortlist if entry[0].get("match_id") not in on_cooldown]
+    
+    match_snapshots.prune({match.get("match_id") for match in matches})
+    if unchanged:
+        log_info(f"Skipped {unchanged} unchanged match(es), {len(shortlist)} to evaluate")
+    
+    if not shortlist:
+        # Still record the feed: replay settles signals against the scores seen in every scan
+        feed_recorder.save(live_feed, {})
+        return 0, 0
+    
+    # Stats fetch, scouting and Gemini overlap; signals print as soon as they clear
+    candidates, alerts_sent, stats_by_id = run_scan_pipeline(shortlist)
+    feed_recorder.save(live_feed, stats_by_id)
+    
+    return candidates, alerts_sent
+
+
+# ============================================
+# 🧩 Sharded Scanning
+# ============================================
+def shard_of(match_id, shards):
+    """Deterministic shard for a match_id (stable across processes and restarts)"""
+    return zlib.crc32(str(match_id).encode()) % shards
+
+
+def partition_matches(matches, shards):
+    parts = [[] for _ in range(shards)]
+    for match in matches:
+        parts[shard_of(match.get("match_id"), shards)].append(match)
+    return parts
+
+
+def key_sharers(key_index, workers):
+    """Processes sending requests on RAPIDAPI_KEYS[key_index]: its workers, plus the coordinator on key 0"""
+    sharers = sum(1 for index in range(workers) if index % len(RAPIDAPI_KEYS) == key_index)
+    return sharers + (1 if key_index == 0 else 0)
+
+
+def use_rapidapi_key(key_index, workers):
+    """Send this process's requests on one key, with that key's rate limit split between its sharers"""
+    global rapidapi_bucket
+    sharers = key_sharers(key_index, workers)
+    rapidapi_session.headers["X-RapidAPI-Key"] = RAPIDAPI_KEYS[key_index]
+    rapidapi_bucket = TokenBucket(RAPIDAPI_RATE_PER_SEC / sharers, max(1, RAPIDAPI_BURST // sharers))
+
+
+def shard_worker(index, workers, tasks, results):
+    """
+    Worker process: scan each match list the coordinator sends.
+    Reports (scan_id, index, candidates, alerts, requests used) per task.
+    """
+    use_rapidapi_key(index % len(RAPIDAPI_KEYS), workers)
+    cooldowns.shared = True  # Cooldowns and alert claims go through the shared SQLite file
+    
+    try:
+        for scan_id, matches in iter(tasks.get, None):
+            used_before = rapidapi_usage.today()
+            try:
+                candidates, alerts = scan_matches(matches)
+            except Exception as e:
+                log_error(f"[Worker {index}] Scan failed: {e}")
+                candidates, alerts = 0, 0
+            results.put((scan_id, index, candidates, alerts, rapidapi_usage.today() - used_before))
+    except KeyboardInterrupt:
+        pass
+
+
+class ShardPool:
+    """
+    N scan worker processes. Each scan's matches are partitioned by match_id
+    over the workers that are alive; a worker that dies mid-scan has its
+    share moved to the survivors, and is restarted before the next scan.
+    """
+
+    def __init__(self, size):
+        self._ctx = multiprocessing.get_context("spawn")
+        self.results = self._ctx.Queue()
+        self.workers = [None] * size  # [(process, task queue)]
+        for index in range(size):
+            self._start(index)
+
+    def _start(self, index):
+        tasks = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=shard_worker, args=(index, len(self.workers), tasks, self.results), daemon=True
+        )
+        process.start()
+        self.workers[index] = (process, tasks)
+
+    def alive(self):
+        return [index for index, (process, _) in enumerate(self.workers) if process.is_alive()]
+
+    def respawn_dead(self):
+        for index, (process, _) in enumerate(self.workers):
+            if not process.is_alive():
+                log_warn(f"Worker {index} exited ({process.exitcode}), restarting")
+                self._start(index)
+
+    def _dispatch(self, scan_id, matches, owners, pending):
+        if not owners:
+            log_warn(f"No live workers, {len(matches)} match(es) wait for the next scan")
+            return
+        for owner, part in zip(owners, partition_matches(matches, len(owners))):
+            if part:
+                self.workers[owner][1].put((scan_id, part))
+                pending.setdefault(owner, []).append(part)
+
+    def scan(self, scan_id, matches, timeout):
+        """Run one scan across the workers: returns (candidates, alerts, requests used)"""
+        pending = {}  # {worker index: [match lists sent, oldest first]}
+        self._dispatch(scan_id, matches, self.alive(), pending)
+        
+        candidates = alerts = requests_used = 0
+        deadline = time.monotonic() + timeout
         
-        # Alert if PLAY and confidence > 75
-        if verdict == "PLAY" and confidence > 75:
-            alerts_sent += 1
-            set_cooldown(match_id)
+        while pending and time.monotonic() < deadline:
+            try:
+                result_scan, index, found, sent, used = self.results.get(timeout=1)
+            except queue.Empty:
+                for index in [index for index in pending if not self.workers[index][0].is_alive()]:
+                    orphaned = [match for part in pending.pop(index) for match in part]
+                    survivors = self.alive()
+                    log_warn(f"Worker {index} died mid-scan, moving {len(orphaned)} match(es) to {len(survivors)} worker(s)")
+                    self._dispatch(scan_id, orphaned, survivors, pending)
+                continue
             
-            emoji = "⏱️" if candidate["strategy_code"] == "IY_05" else "🔥"
-            strategy_label = "IY GOL" if candidate["strategy_code"] == "IY_05" else "MS GOL"
+            requests_used += used
+            if result_scan != scan_id or index not in pending:
+                continue  # Late result from a scan that already timed out
             
-            print()
-            print(f"{Colors.GREEN}{Colors.BOLD}{'='*60}{Colors.END}")
-            log_signal(f"[{strategy_label}] {candidate['home']} vs {candidate['away']}")
-            print(f"   Time: {candidate['minute']}' | Score: {candidate['score']} | League: {candidate['league']}")
-            print(f"   Shots: {candidate['stats']['total_shots']} | SoT: {candidate['stats']['shots_on_target']} | xG: {candidate['stats']['xG']}")
-            print(f"   Confidence: {Colors.GREEN}{confidence}%{Colors.END}")
-            print(f"   Reason: {reason}")
-            print(f"{Colors.GREEN}{Colors.BOLD}{'='*60}{Colors.END}")
-            print()
-        else:
-            log_info(f"❌ Skipped: {candidate['home']} vs {candidate['away']} (Conf: {confidence}%)")
+            pending[index].pop(0)
+            if not pending[index]:
+                del pending[index]
+            candidates += found
+            alerts += sent
         
-        # Small delay between API calls
-        time.sleep(0.5)
+        if pending:
+            log_warn(f"{len(pending)} worker(s) did not finish scan #{scan_id} within {timeout}s")
+        return candidates, alerts, requests_used
+
+    def close(self):
+        for process, tasks in self.workers:
+            if process.is_alive():
+                tasks.put(None)
+        for process, _ in self.workers:
+            process.join(timeout=5)
+
+
+def run_sharded_scan(pool, scan_id):
+    """Fetch the live feed once and split its matches across the worker pool"""
+    live_feed = fetch_live_feed()
+    matches = flatten_live_feed(live_feed)
+    poll_scheduler.observe_live(matches)
+    
+    if not matches:
+        log_info("No live matches found")
+        return 0, 0
     
-    return candidates_found, alerts_sent
+    pool.respawn_dead()
+    candidates, alerts, requests_used = pool.scan(scan_id, matches, SHARD_SCAN_TIMEOUT)
+    rapidapi_usage.increment(requests_used)  # Workers count their own; fold them into the budget
+    return candidates, alerts
 
 
 # ============================================
 # 🚀 Main Entry Point
 # ============================================
-def main():
+def main(workers=1):
     print()
     print(f"{Colors.GREEN}{Colors.BOLD}+======================================================+{Colors.END}")
     print(f"{Colors.GREEN}{Colors.BOLD}|       GoalGPT Pro v3.0 - Live Betting Bot            |{Colors.END}")
@@ -481,9 +2017,32 @@ def main():
     print(f"{Colors.GREEN}{Colors.BOLD}+======================================================+{Colors.END}")
     print()
     
-    log_info(f"Poll Interval: {POLL_INTERVAL}s (3 minutes)")
-    log_info(f"Cooldown: {COOLDOWN_MINUTES} minutes")
-    log_info("Strategies: First Half Sniper (15-40') + Late Game Momentum (60-85')")
+    log_info(f"Poll Interval: {POLL_MIN_INTERVAL}-{POLL_IDLE_INTERVAL}s (baseline {POLL_INTERVAL}s)")
+    log_info(f"Daily Request Budget: {DAILY_REQUEST_BUDGET}")
+    log_info(f"Cooldown: {COOLDOWN_MINUTES} minutes ({len(cooldowns)} active from last run)")
+    log_info(f"Stats fetch: {STATS_MAX_INFLIGHT} in flight, {RAPIDAPI_RATE_PER_SEC}/s (burst {RAPIDAPI_BURST})")
+    log_info("Strategies: " + " + ".join(
+        f"{strategy['name']} ({strategy['window'][0]}-{strategy['window'][1]}')" for strategy in STRATEGIES
+    ))
+    if prescreen.model is not None:
+        log_info(
+            f"Pre-screen: {prescreen.model['examples']}-signal model, Gemini only for "
+            f"{PRESCREEN_SKIP_BELOW:.0%}-{PRESCREEN_PLAY_ABOVE:.0%} goal probability"
+        )
+    
+    pool = None
+    if workers > 1:
+        if not COOLDOWN_DB:
+            log_error("Sharded mode needs COOLDOWN_DB so workers can share cooldowns")
+            sys.exit(1)
+        keys = min(workers, len(RAPIDAPI_KEYS))
+        poll_scheduler.daily_budget = DAILY_REQUEST_BUDGET * keys
+        use_rapidapi_key(0, workers)  # The coordinator's live-feed calls share key 0 with its workers
+        if RECORD_DIR:
+            log_warn("Feed recording is not available in sharded mode")
+        log_info(f"Sharded: {workers} workers over {keys} API key(s)")
+        pool = ShardPool(workers)
+    
     log_success("Bot started! Press Ctrl+C to stop.")
     print()
     
@@ -495,17 +2054,31 @@ def main():
             current_time = datetime.now().strftime("%H:%M:%S")
             log_info(f"[Scan #{scan_count}] Starting at {current_time}...")
             
-            candidates, alerts = run_scan()
+            used_before = rapidapi_usage.today()
+            candidates, alerts = run_sharded_scan(pool, scan_count) if pool else run_scan()
+            poll_scheduler.observe_scan(rapidapi_usage.today() - used_before)
             
             if alerts > 0:
                 log_success(f"Scan complete: {alerts} alert(s) sent!")
             else:
                 log_info(f"Scan complete: {candidates} candidate(s) analyzed, no alerts.")
             
-            log_info(f"Next scan in {POLL_INTERVAL}s...")
+            if not pool:
+                log_info(f"Stats cache: {stats_cache.hits} hits / {stats_cache.misses} misses ({stats_cache.hit_rate()}%)")
+                log_info(f"Verdict cache: {verdict_cache.hits} hits / {verdict_cache.misses} misses ({verdict_cache.hit_rate()}%)")
+                if prescreen.model is not None:
+                    counts, skipped, share = prescreen.report()
+                    log_info(
+                        f"Pre-screen: {skipped}/{counts['scored']} skipped Gemini ({share}%) | "
+                        f"{counts['local_skip']} local SKIP / {counts['local_play']} local PLAY"
+                    )
+            interval = poll_scheduler.next_interval()
+            spent, projected = poll_scheduler.report(interval)
+            log_info(f"API budget: {spent}/{poll_scheduler.daily_budget} used today, ~{projected} projected")
+            log_info(f"Next scan in {interval}s...")
             print("-" * 50)
             
-            time.sleep(POLL_INTERVAL)
+            time.sleep(interval)
         
         except KeyboardInterrupt:
             print()
@@ -516,7 +2089,26 @@ def main():
             log_error(f"Unexpected error: {e}")
             log_info("Retrying in 60 seconds...")
             time.sleep(60)
+    
+    if pool:
+        pool.close()
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        if len(sys.argv) < 3:
+            log_error("Usage: python goalgpt_pro.py replay <snapshot_dir> [workers]")
+            sys.exit(1)
+        run_replay(sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else None)
+    elif len(sys.argv) > 1 and sys.argv[1] == "train":
+        if len(sys.argv) < 3:
+            log_error("Usage: python goalgpt_pro.py train <snapshot_dir> [model_path]")
+            sys.exit(1)
+        train_prescreen(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else PRESCREEN_MODEL)
+    elif len(sys.argv) > 1 and sys.argv[1] == "shards":
+        if len(sys.argv) < 3 or not sys.argv[2].isdigit():
+            log_error("Usage: python goalgpt_pro.py shards <workers>")
+            sys.exit(1)
+        main(int(sys.argv[2]))
+    else:
+        main()